@@ -17,13 +17,21 @@ const MAX_CONTENT_LEN = 200;
 
 /** Split "[label] rest" into a dimmed bracket + truncated content */
 function renderContent(content: string) {
-  const match = content.match(/^(\[[^\]]*\])\s?(.*)/s);
-  if (!match) return content;
-  const rest = match[2] || '';
-  const truncated = rest.length > MAX_CONTENT_LEN ? rest.slice(0, MAX_CONTENT_LEN) + '…' : rest;
+  // Split off a leading "[label]" with a linear scan; entries can hold large
+  // tool output, so avoid a regex that captures the whole remainder.
+  if (content[0] !== '[') return content;
+  const labelEnd = content.indexOf(']');
+  if (labelEnd === -1) return content;
+  let restStart = labelEnd + 1;
+  if (restStart < content.length && content[restStart].trim() === '') restStart++;
+  const restLen = content.length - restStart;
+  const truncated =
+    restLen > MAX_CONTENT_LEN
+      ? content.slice(restStart, restStart + MAX_CONTENT_LEN) + '…'
+      : content.slice(restStart);
   return (
     <>
-      <span className={styles.bracketLabel}>{match[1]}</span>
+      <span className={styles.bracketLabel}>{content.slice(0, labelEnd + 1)}</span>
       {truncated ? ' ' + truncated : ''}
     </>
   );
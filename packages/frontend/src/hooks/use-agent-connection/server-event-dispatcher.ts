@@ -24,6 +24,8 @@ export interface ServerEventDispatchHandlers {
     content: string,
     type: 'thinking' | 'response',
     monitorId?: string,
+    /** Append to the current streaming entry of the same type instead of replacing it */
+    append?: boolean,
   ) => void;
   finalizeCliStreaming: (agentId: string) => void;
   addCliEntry: (entry: {
@@ -114,7 +116,13 @@ export function dispatchServerEvent(message: ServerEvent, handlers: ServerEventD
       const agentId = extractAgentId(message);
       const monitorId = (message as { monitorId?: string }).monitorId;
       handlers.setAgentActive(agentId, message.content ? 'Reasoning...' : 'Thinking...');
-      handlers.updateCliStreaming(agentId, message.content ?? '', 'thinking', monitorId);
+      handlers.updateCliStreaming(
+        agentId,
+        message.content ?? '',
+        'thinking',
+        monitorId,
+        message.isDelta,
+      );
       handlers.clearAllMessageStatuses();
       break;
     }
@@ -124,10 +132,21 @@ export function dispatchServerEvent(message: ServerEvent, handlers: ServerEventD
       const monitorId = (message as { monitorId?: string }).monitorId;
       if (isComplete) {
         handlers.clearAgent(agentId);
+        // The final event carries the full text; replace the streamed buffer so
+        // deltas missed by this client don't end up in history.
+        if (message.content) {
+          handlers.updateCliStreaming(agentId, message.content, 'response', monitorId, false);
+        }
         handlers.finalizeCliStreaming(agentId);
       } else {
         handlers.setAgentActive(agentId, 'Responding...');
-        handlers.updateCliStreaming(agentId, message.content, 'response', monitorId);
+        handlers.updateCliStreaming(
+          agentId,
+          message.content,
+          'response',
+          monitorId,
+          message.isDelta,
+        );
       }
       break;
     }
@@ -35,13 +35,14 @@ export const createCliSlice: SliceCreator<CliSlice> = (set, _get) => ({
       state.cliHistory[monitorId] = capArray(state.cliHistory[monitorId], MAX_CLI_ENTRIES);
     }),
 
-  updateCliStreaming: (agentId, content, type, monitorId) =>
+  updateCliStreaming: (agentId, content, type, monitorId, append) =>
     set((state) => {
       const mid = monitorId || '0';
+      const existing = state.cliStreaming[agentId];
       state.cliStreaming[agentId] = {
         id: `cli-stream-${agentId}`,
         type,
-        content,
+        content: append && existing?.type === type ? existing.content + content : content,
         agentId,
         monitorId: mid,
         timestamp: Date.now(),
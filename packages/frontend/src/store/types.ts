@@ -303,6 +303,8 @@ export interface CliSliceActions {
     content: string,
     type: 'thinking' | 'response',
     monitorId?: string,
+    /** Append to the current streaming entry of the same type instead of replacing it */
+    append?: boolean,
   ) => void;
   finalizeCliStreaming: (agentId: string) => void;
   clearCliHistory: (monitorId?: string) => void;
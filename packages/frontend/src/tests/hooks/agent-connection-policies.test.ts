@@ -5,6 +5,7 @@ import {
   shouldReconnect,
 } from '@/hooks/use-agent-connection/transport-manager';
 import { dispatchServerEvent } from '@/hooks/use-agent-connection/server-event-dispatcher';
+import { useDesktopStore } from '@/store';
 
 function createHandlers() {
   return {
@@ -71,6 +72,61 @@ describe('server event dispatcher', () => {
     expect(handlers.clearAgent).toHaveBeenCalledWith('a1');
   });
 
+  it('forwards streaming deltas as appends', () => {
+    const handlers = createHandlers();
+
+    dispatchServerEvent(
+      { type: 'AGENT_RESPONSE', content: 'Hel', isComplete: false, isDelta: false, agentId: 'a1' },
+      handlers,
+    );
+    dispatchServerEvent(
+      { type: 'AGENT_RESPONSE', content: 'lo', isComplete: false, isDelta: true, agentId: 'a1' },
+      handlers,
+    );
+    expect(handlers.updateCliStreaming).toHaveBeenCalledWith(
+      'a1',
+      'Hel',
+      'response',
+      undefined,
+      false,
+    );
+    expect(handlers.updateCliStreaming).toHaveBeenCalledWith(
+      'a1',
+      'lo',
+      'response',
+      undefined,
+      true,
+    );
+  });
+
+  it('saves the full final text when streamed deltas were missed', () => {
+    const store = useDesktopStore.getState();
+    store.clearCliHistory();
+    const handlers = {
+      ...createHandlers(),
+      updateCliStreaming: store.updateCliStreaming,
+      finalizeCliStreaming: store.finalizeCliStreaming,
+    };
+
+    dispatchServerEvent(
+      { type: 'AGENT_RESPONSE', content: 'Hel', isComplete: false, isDelta: false, agentId: 'a1' },
+      handlers,
+    );
+    // The 'lo' delta never reached this client (e.g. it was reconnecting)
+    dispatchServerEvent(
+      { type: 'AGENT_RESPONSE', content: '!', isComplete: false, isDelta: true, agentId: 'a1' },
+      handlers,
+    );
+    dispatchServerEvent(
+      { type: 'AGENT_RESPONSE', content: 'Hello!', isComplete: true, agentId: 'a1' },
+      handlers,
+    );
+
+    const state = useDesktopStore.getState();
+    expect(state.cliStreaming.a1).toBeUndefined();
+    expect(state.cliHistory['0'].at(-1)).toMatchObject({ type: 'response', content: 'Hello!' });
+  });
+
   it('dispatches tool progress as active status updates', () => {
     const handlers = createHandlers();
     dispatchServerEvent(
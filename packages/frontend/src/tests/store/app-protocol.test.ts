@@ -3,7 +3,7 @@
  * from the server to the target iframe via postMessage, collects responses,
  * and pushes them into the store.
  */
-import { describe, it, expect, beforeEach, afterEach, mock } from 'bun:test';
+import { describe, it, expect, beforeEach, afterEach, mock, spyOn } from 'bun:test';
 import { handleAppProtocolRequest, useDesktopStore } from '@/store';
 import { toWindowKey } from '@/store/helpers';
 import type { AppProtocolRequest } from '@yaar/shared';
@@ -44,17 +44,14 @@ function createWindowElement(windowId: string): {
 }
 
 describe('handleAppProtocolRequest', () => {
-  let originalSetTimeout: typeof globalThis.setTimeout;
-
   beforeEach(() => {
     resetStore();
-    originalSetTimeout = globalThis.setTimeout;
     // Clean up any leftover DOM nodes from prior tests
     document.body.innerHTML = '';
   });
 
   afterEach(() => {
-    globalThis.setTimeout = originalSetTimeout;
+    mock.restore();
     document.body.innerHTML = '';
   });
 
@@ -154,10 +151,10 @@ describe('handleAppProtocolRequest', () => {
     });
 
     // Override setTimeout to invoke the callback immediately (simulates timer expiry)
-    globalThis.setTimeout = ((fn: () => void, _delay?: number) => {
+    spyOn(globalThis, 'setTimeout').mockImplementation(((fn: () => void) => {
       fn();
       return 0 as unknown as ReturnType<typeof setTimeout>;
-    }) as typeof globalThis.setTimeout;
+    }) as typeof globalThis.setTimeout);
 
     const request: AppProtocolRequest = {
       kind: 'command',
@@ -58,6 +58,8 @@ export interface HandleMessageOptions {
   windowId?: string;
 }
 
+const WINDOW_ROLE_PREFIX = 'window-';
+
 /**
  * Build a scope context section so the agent knows its place in the hierarchy.
  * - Monitor agents: scoped to a monitor, use bare window IDs
@@ -65,9 +67,10 @@ export interface HandleMessageOptions {
  */
 function buildScopeSection(role: string, monitorId?: string): string {
   // Window agent: role is "window-{windowId}" or "window-{windowId}/{actionId}"
-  const windowMatch = role.match(/^window-(.+?)(?:\/|$)/);
-  if (windowMatch) {
-    const windowId = windowMatch[1];
+  if (role.length > WINDOW_ROLE_PREFIX.length && role.startsWith(WINDOW_ROLE_PREFIX)) {
+    // windowId is at least one char, ending at the next '/' (if any)
+    const slash = role.indexOf('/', WINDOW_ROLE_PREFIX.length + 1);
+    const windowId = role.slice(WINDOW_ROLE_PREFIX.length, slash === -1 ? undefined : slash);
     return `\n\n## Scope\nYou are a **window agent** for \`${windowId}\`. Your actions are limited to this window. Use \`yaar://windows/${windowId}\` to address it.`;
   }
 
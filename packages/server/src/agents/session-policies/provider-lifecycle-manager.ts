@@ -46,6 +46,19 @@ export class ProviderLifecycleManager {
   }
 
   async setProvider(providerType: ProviderType): Promise<void> {
+    // Already on a working provider of this type: keep the live process/thread and
+    // its session rather than disposing and respawning an identical one (RESET
+    // clears state). A dead provider (e.g. crashed app-server) is replaced below.
+    const current = this.state.provider;
+    if (current?.providerType === providerType && (await current.isAvailable())) {
+      await this.sendEvent({
+        type: ServerEventType.CONNECTION_STATUS,
+        status: 'connected',
+        provider: current.name,
+      });
+      return;
+    }
+
     const available = await getAvailableProviders();
     if (!available.includes(providerType)) {
       await this.sendEvent({
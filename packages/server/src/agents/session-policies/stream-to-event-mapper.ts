@@ -4,9 +4,15 @@ import type { SessionLogger } from '../../logging/index.js';
 import type { ContextSource } from '../context.js';
 import { formatToolDisplay } from '../../mcp/server.js';
 import { actionEmitter } from '../../session/action-emitter.js';
+import { getBroadcastCenter } from '../../session/broadcast-center.js';
 import { getToolUseHooks, type ToolUseContext } from '../../features/config/hooks.js';
 import { VERB_TOOL_NAMES } from '../../handlers/index.js';
 
+/** Verb tool name → bare verb (e.g. 'mcp__verbs__read' → 'read'), resolved once. */
+const VERB_BY_TOOL_NAME: ReadonlyMap<string, string> = new Map(
+  VERB_TOOL_NAMES.map((name) => [name, name.slice('mcp__verbs__'.length)]),
+);
+
 export interface StreamMappingState {
   responseText: string;
   thinkingText: string;
@@ -17,6 +23,12 @@ export class StreamToEventMapper {
   private lastThinkingEmitTime = 0;
   private lastFlushedThinkingLength = 0;
   private thinkingDirty = false;
+  /** Which stream the client is currently showing, and how much of each it has received */
+  private lastStreamedKind: 'response' | 'thinking' | null = null;
+  private sentResponseLength = 0;
+  private sentThinkingLength = 0;
+  /** Broadcast subscription epoch at the last streamed send */
+  private streamedEpoch = 0;
   private toolStartTimes = new Map<string, { toolName: string; startTime: number }>();
 
   constructor(
@@ -48,7 +60,7 @@ export class StreamToEventMapper {
           this.state.responseText += message.content;
           await this.sendEvent({
             type: ServerEventType.AGENT_RESPONSE,
-            content: this.state.responseText,
+            ...this.nextChunk('response'),
             isComplete: false,
             agentId: this.role,
             monitorId: this.monitorId,
@@ -68,7 +80,7 @@ export class StreamToEventMapper {
             this.lastThinkingEmitTime = now;
             await this.sendEvent({
               type: ServerEventType.AGENT_THINKING,
-              content: this.state.thinkingText,
+              ...this.nextChunk('thinking'),
               agentId: this.role,
               monitorId: this.monitorId,
             });
@@ -81,11 +93,12 @@ export class StreamToEventMapper {
         const rawName = message.toolName ?? 'unknown';
         let displayName = formatToolDisplay(rawName);
         let displayInput = message.toolInput;
+        // Resolved once — both the display and the hook context need them
+        const verb = VERB_BY_TOOL_NAME.get(rawName);
+        const input = message.toolInput as Record<string, unknown> | undefined;
 
         // For verb tools, embed URI in the display name and show only the payload
-        if ((VERB_TOOL_NAMES as readonly string[]).includes(rawName)) {
-          const input = message.toolInput as Record<string, unknown> | undefined;
-          const verb = rawName.replace('mcp__verbs__', '');
+        if (verb) {
           const uri = input?.uri;
           displayName = uri ? `${verb}:(${uri})` : verb;
           // Strip uri from display input, show only payload (or nothing)
@@ -103,15 +116,10 @@ export class StreamToEventMapper {
           agentId: this.role,
           monitorId: this.monitorId,
         });
-        this.logger?.logToolUse(
-          message.toolName ?? 'unknown',
-          message.toolInput,
-          message.toolUseId,
-          this.role,
-        );
+        this.logger?.logToolUse(rawName, message.toolInput, message.toolUseId, this.role);
         if (message.toolUseId) {
           this.toolStartTimes.set(message.toolUseId, {
-            toolName: message.toolName ?? 'unknown',
+            toolName: rawName,
             startTime: Date.now(),
           });
         }
@@ -120,9 +128,8 @@ export class StreamToEventMapper {
         const hookCtx: ToolUseContext = { toolName: displayName };
 
         // For verb tools, extract verb/uri/action from toolInput
-        if ((VERB_TOOL_NAMES as readonly string[]).includes(rawName)) {
-          const input = message.toolInput as Record<string, unknown> | undefined;
-          hookCtx.verb = rawName.replace('mcp__verbs__', '');
+        if (verb) {
+          hookCtx.verb = verb;
           if (input?.uri && typeof input.uri === 'string') hookCtx.uri = input.uri;
           if (input?.payload && typeof input.payload === 'object' && input.payload !== null) {
             const action = (input.payload as Record<string, unknown>).action;
@@ -247,13 +254,18 @@ export class StreamToEventMapper {
   private async flushThinking(): Promise<void> {
     if (!this.thinkingDirty) return;
 
-    // Emit final thinking event with full accumulated text
-    await this.sendEvent({
-      type: ServerEventType.AGENT_THINKING,
-      content: this.state.thinkingText,
-      agentId: this.role,
-      monitorId: this.monitorId,
-    });
+    // Emit whatever the throttle held back since the last thinking event
+    if (
+      this.lastStreamedKind !== 'thinking' ||
+      this.sentThinkingLength < this.state.thinkingText.length
+    ) {
+      await this.sendEvent({
+        type: ServerEventType.AGENT_THINKING,
+        ...this.nextChunk('thinking'),
+        agentId: this.role,
+        monitorId: this.monitorId,
+      });
+    }
 
     // Log only the new thinking text since last flush (handles multiple thinking blocks)
     const newText = this.state.thinkingText.slice(this.lastFlushedThinkingLength);
@@ -265,4 +277,22 @@ export class StreamToEventMapper {
     this.thinkingDirty = false;
     this.lastThinkingEmitTime = 0;
   }
+
+  /**
+   * Content for the next streamed event of `kind`: only the text added since the
+   * last send, or the full text when the client was last showing the other kind
+   * (it replaced its buffer then, so there is nothing to append to) or when a
+   * connection subscribed since the last send (it has missed the earlier deltas).
+   */
+  private nextChunk(kind: 'response' | 'thinking'): { content: string; isDelta: boolean } {
+    const text = kind === 'response' ? this.state.responseText : this.state.thinkingText;
+    const sent = kind === 'response' ? this.sentResponseLength : this.sentThinkingLength;
+    const epoch = getBroadcastCenter().getSubscriptionEpoch();
+    const isDelta = this.lastStreamedKind === kind && this.streamedEpoch === epoch;
+    this.lastStreamedKind = kind;
+    this.streamedEpoch = epoch;
+    if (kind === 'response') this.sentResponseLength = text.length;
+    else this.sentThinkingLength = text.length;
+    return { content: isDelta ? text.slice(sent) : text, isDelta };
+  }
 }
@@ -23,7 +23,17 @@ function stampWindowHandle(
   return { ...action, windowId: handle } as OSAction;
 }
 
+/** Actions waiting to go out together as one ACTIONS event. */
+interface PendingActionBatch {
+  actions: OSAction[];
+  agentId: string;
+  monitorId?: string;
+  sent: Promise<void>;
+}
+
 export class ToolActionBridge {
+  private pendingBatch: PendingActionBatch | null = null;
+
   constructor(
     private readonly state: ToolActionBridgeState,
     private readonly sendEvent: (event: ServerEvent) => Promise<void>,
@@ -61,12 +71,29 @@ export class ToolActionBridge {
       this.resolveWindowHandle,
     );
 
-    await this.sendEvent({
-      type: ServerEventType.ACTIONS,
-      actions: [action],
-      agentId: uiAgentId,
-      monitorId,
-    });
     this.getLogger()?.logAction(action, uiAgentId);
+    await this.enqueue(action, uiAgentId, monitorId);
+  }
+
+  /**
+   * Coalesce actions emitted within the same tick (e.g. a handler creating a
+   * window and then setting its content) into a single ACTIONS event, so each
+   * burst costs one JSON encode and one WebSocket frame per client.
+   */
+  private enqueue(action: OSAction, agentId: string, monitorId?: string): Promise<void> {
+    const current = this.pendingBatch;
+    if (current && current.agentId === agentId && current.monitorId === monitorId) {
+      current.actions.push(action);
+      return current.sent;
+    }
+
+    const actions = [action];
+    // Microtasks run in FIFO order, so an earlier batch still goes out first
+    const sent = Promise.resolve().then(() => {
+      if (this.pendingBatch?.actions === actions) this.pendingBatch = null;
+      return this.sendEvent({ type: ServerEventType.ACTIONS, actions, agentId, monitorId });
+    });
+    this.pendingBatch = { actions, agentId, monitorId, sent };
+    return sent;
   }
 }
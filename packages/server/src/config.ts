@@ -18,13 +18,16 @@ export const IS_BUNDLED_EXE = typeof __YAAR_BUNDLED !== 'undefined' && __YAAR_BU
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
 
+/** Directory containing the running executable (install dir of the bundled exe). */
+const EXE_DIR = dirname(process.execPath);
+
 /**
  * Project root directory.
  * - Bundled exe: directory containing the executable
  * - Development: 3 levels up from src/ (packages/server/src → project root)
  */
 export const PROJECT_ROOT = IS_BUNDLED_EXE
-  ? dirname(process.execPath)
+  ? EXE_DIR
   : join(__dirname, '..', '..', '..');
 
 /**
@@ -64,7 +67,7 @@ export function getFrontendDist(): string {
     return process.env.FRONTEND_DIST;
   }
   if (IS_BUNDLED_EXE) {
-    return join(dirname(process.execPath), 'public');
+    return join(EXE_DIR, 'public');
   }
   return join(PROJECT_ROOT, 'packages', 'frontend', 'dist');
 }
@@ -126,30 +129,66 @@ export const MONITOR_MAX_CONCURRENT = getEnvInt('MONITOR_MAX_CONCURRENT', 2);
 export const MONITOR_MAX_ACTIONS_PER_MIN = getEnvInt('MONITOR_MAX_ACTIONS_PER_MIN', 30);
 export const MONITOR_MAX_OUTPUT_PER_MIN = getEnvInt('MONITOR_MAX_OUTPUT_PER_MIN', 50000);
 
+const IS_WINDOWS = process.platform === 'win32';
+
+/** Executable suffix for bundled/installed CLI binaries on this platform. */
+const EXE_EXT = IS_WINDOWS ? '.exe' : '';
+const CLAUDE_BIN_NAME = `claude${EXE_EXT}`;
+const CODEX_BIN_NAME = `codex${EXE_EXT}`;
+
+// Resolved CLI locations. Only hits are cached, so a CLI installed after
+// startup is still picked up by the next availability check.
+let claudeBinPath: { key: string; path: string } | null = null;
+let codexSpawnArgs: string[] | null = null;
+
+/**
+ * Forget the resolved location of one CLI. Called when its `--version` probe fails,
+ * so a CLI that was moved or uninstalled is looked up again instead of re-spawned.
+ */
+export function clearCliPathCache(cli: 'claude' | 'codex'): void {
+  if (cli === 'claude') claudeBinPath = null;
+  else codexSpawnArgs = null;
+}
+
+/** Path to `name` next to the bundled executable, or null if it isn't shipped there. */
+function findNextToExe(name: string): string | null {
+  const path = join(EXE_DIR, name);
+  return existsSync(path) ? path : null;
+}
+
 /**
  * Resolve the absolute path to the claude binary (exe/binary only, not .cmd wrappers).
- * Returns null if no binary is found on disk.
+ * Returns null if no binary is found on disk. Successful lookups are memoized.
  *
  * Used by the Agent SDK's `pathToClaudeCodeExecutable` option so the SDK doesn't
  * need to locate its own bundled binary (which is inaccessible in a compiled exe).
  */
 export function resolveClaudeBinPath(): string | null {
-  const ext = process.platform === 'win32' ? '.exe' : '';
+  // Keyed on the env vars the lookup reads, so changing them re-resolves
+  const home = process.env.USERPROFILE || process.env.HOME || '';
+  const key = `${process.env.CLAUDE_CODE_PATH ?? ''}\0${home}`;
+  if (claudeBinPath?.key === key) return claudeBinPath.path;
+
+  const path = findClaudeBinPath();
+  claudeBinPath = path ? { key, path } : null;
+  return path;
+}
 
+function findClaudeBinPath(): string | null {
   // 1. Honor CLAUDE_CODE_PATH override (.env or shell)
   const override = process.env.CLAUDE_CODE_PATH;
   if (override && existsSync(override)) return override;
 
   // 2. Check next to the executable (bundled exe ships claude alongside)
   if (IS_BUNDLED_EXE) {
-    const localBin = join(dirname(process.execPath), `claude${ext}`);
-    if (existsSync(localBin)) return localBin;
+    const localBin = findNextToExe(CLAUDE_BIN_NAME);
+    if (localBin) return localBin;
   }
 
   // 3. Check ~/.local/bin/ (standard install location on Windows and Linux)
   const home = process.env.USERPROFILE || process.env.HOME;
   if (home) {
-    const dotLocalBin = join(home, '.local', 'bin', `claude${ext}`);
+    const dotLocalBin = join(home, '.local', 'bin', CLAUDE_BIN_NAME);
     if (existsSync(dotLocalBin)) return dotLocalBin;
   }
 
@@ -168,13 +207,9 @@ export function getClaudeSpawnArgs(): string[] {
   const binPath = resolveClaudeBinPath();
   if (binPath) return [binPath];
 
-  if (IS_BUNDLED_EXE && process.platform === 'win32') {
-    // .cmd wrappers need `cmd /c` to execute via uv_spawn
-    const npmPrefix = process.env.APPDATA ? join(process.env.APPDATA, 'npm') : null;
-    if (npmPrefix) {
-      const cmdPath = join(npmPrefix, 'claude.cmd');
-      if (existsSync(cmdPath)) return ['cmd', '/c', cmdPath];
-    }
+  if (IS_BUNDLED_EXE && IS_WINDOWS) {
+    const npmCmd = findNpmCmdWrapper('claude');
+    if (npmCmd) return npmCmd;
   }
 
   return ['claude'];
@@ -190,23 +225,32 @@ export function getClaudeSpawnArgs(): string[] {
  *   `Bun.spawn([...getCodexSpawnArgs(), 'app-server', ...])`
  */
 export function getCodexSpawnArgs(): string[] {
+  if (codexSpawnArgs) return codexSpawnArgs;
+  const args = findCodexSpawnArgs();
+  if (args) codexSpawnArgs = args;
+  return args ?? ['codex'];
+}
+
+function findCodexSpawnArgs(): string[] | null {
   if (IS_BUNDLED_EXE) {
     // 1. Check next to the executable
-    const ext = process.platform === 'win32' ? '.exe' : '';
-    const localBin = join(dirname(process.execPath), `codex${ext}`);
-    if (existsSync(localBin)) return [localBin];
+    const localBin = findNextToExe(CODEX_BIN_NAME);
+    if (localBin) return [localBin];
 
     // 2. On Windows, resolve npm global bin (codex.cmd wrapper)
-    //    .cmd files need `cmd /c` to execute via uv_spawn
-    if (process.platform === 'win32') {
-      const npmPrefix = process.env.APPDATA ? join(process.env.APPDATA, 'npm') : null;
-      if (npmPrefix) {
-        const cmdPath = join(npmPrefix, 'codex.cmd');
-        if (existsSync(cmdPath)) return ['cmd', '/c', cmdPath];
-      }
-    }
+    if (IS_WINDOWS) return findNpmCmdWrapper('codex');
   }
-  return ['codex'];
+  return null;
+}
+
+/**
+ * Spawn args for an npm global `.cmd` wrapper on Windows, or null if absent.
+ * .cmd files need `cmd /c` to execute via uv_spawn.
+ */
+function findNpmCmdWrapper(name: string): string[] | null {
+  if (!process.env.APPDATA) return null;
+  const cmdPath = join(process.env.APPDATA, 'npm', `${name}.cmd`);
+  return existsSync(cmdPath) ? ['cmd', '/c', cmdPath] : null;
 }
 
 // ── Codex app-server configuration ────────────────────────────────────
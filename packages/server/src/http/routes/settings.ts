@@ -7,7 +7,7 @@
  */
 
 import { readSettings, updateSettings } from '../../storage/settings.js';
-import { getWarmPool } from '../../providers/factory.js';
+import { getWarmPool, invalidateAvailabilityCache } from '../../providers/factory.js';
 import {
   readAllowedDomains,
   isAllDomainsAllowed,
@@ -61,6 +61,7 @@ export async function handleSettingsRoutes(req: Request, url: URL): Promise<Resp
 
       // Reinitialize warm pool when provider changes
       if (providerChanging) {
+        invalidateAvailabilityCache();
         const warmPool = getWarmPool();
         await warmPool.cleanup();
         await warmPool.initialize();
@@ -264,17 +264,25 @@ export async function handleMcpRequest(req: Request, serverName: McpServerName):
   );
 }
 
+const SUBAGENT_MCP_TOOL_PATTERN = /^subagent:mcp__\w+__(.+)$/;
+const MCP_TOOL_PATTERN = /^mcp__(\w+)__(.+)$/;
+
 /**
  * Format a raw MCP tool name for CLI display.
  * "mcp__apps__read_ts" → "apps:read_ts"
  * "subagent:mcp__verbs__read" → "subagent:read"
  */
 export function formatToolDisplay(raw: string): string {
-  // subagent progress with nested MCP name: "subagent:mcp__verbs__read" → "subagent:read"
-  const sub = raw.match(/^subagent:mcp__\w+__(.+)$/);
-  if (sub) return `subagent:${sub[1]}`;
-  const m = raw.match(/^mcp__(\w+)__(.+)$/);
-  if (m) return `${m[1]}:${m[2]}`;
+  // Runs for every tool event; prefix checks keep non-MCP names (builtins,
+  // Codex "server:tool" names) away from the regexes entirely.
+  if (raw.startsWith('mcp__')) {
+    const m = raw.match(MCP_TOOL_PATTERN);
+    if (m) return `${m[1]}:${m[2]}`;
+  } else if (raw.startsWith('subagent:mcp__')) {
+    // subagent progress with nested MCP name: "subagent:mcp__verbs__read" → "subagent:read"
+    const sub = raw.match(SUBAGENT_MCP_TOOL_PATTERN);
+    if (sub) return `subagent:${sub[1]}`;
+  }
   return raw;
 }
 
@@ -9,6 +9,32 @@
 
 import type { AITransport, StreamMessage, TransportOptions, ProviderType } from './types.js';
 
+/** How long a `--version` probe may run before the CLI is treated as unavailable. */
+const CLI_PROBE_TIMEOUT_MS = 10_000;
+
+/**
+ * Check that a CLI runs by spawning it with `--version`.
+ * There is no shell, so the command is resolved on PATH with Bun.which first and
+ * Windows `.cmd`/`.bat` shims (npm, nvm, volta, scoop, pnpm) are run via `cmd /c`.
+ * @param spawnArgs - The command and any prefix args (e.g. from getClaudeSpawnArgs()).
+ */
+export async function probeCliVersion(spawnArgs: readonly string[]): Promise<boolean> {
+  const [command, ...prefixArgs] = spawnArgs;
+  const resolved = command ? Bun.which(command) : null;
+  if (!resolved) return false;
+  const argv = /\.(cmd|bat)$/i.test(resolved) ? ['cmd', '/c', resolved] : [resolved];
+  try {
+    // Async spawn so concurrent availability checks don't block each other
+    const proc = Bun.spawn([...argv, ...prefixArgs, '--version'], {
+      stdio: ['ignore', 'ignore', 'ignore'],
+      timeout: CLI_PROBE_TIMEOUT_MS,
+    });
+    return (await proc.exited) === 0;
+  } catch {
+    return false;
+  }
+}
+
 export abstract class BaseTransport implements AITransport {
   abstract readonly name: string;
   abstract readonly providerType: ProviderType;
@@ -83,14 +109,7 @@ export abstract class BaseTransport implements AITransport {
    * @param spawnArgs - The command and any prefix args (e.g. from getClaudeSpawnArgs()).
    *                    '--version' is appended automatically.
    */
-  protected async isCliAvailable(...spawnArgs: string[]): Promise<boolean> {
-    try {
-      const { execSync } = await import('child_process');
-      const fullCmd = [...spawnArgs, '--version'].map((a) => `"${a}"`).join(' ');
-      execSync(fullCmd, { stdio: 'ignore' });
-      return true;
-    } catch {
-      return false;
-    }
+  protected isCliAvailable(...spawnArgs: string[]): Promise<boolean> {
+    return probeCliVersion(spawnArgs);
   }
 }
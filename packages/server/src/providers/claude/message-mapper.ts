@@ -26,48 +26,66 @@ let currentBlockIndex = -1;
  * Returns null for messages that should be skipped.
  */
 export function mapClaudeMessage(msg: SDKMessage): StreamMessage | null {
-  // Log important message types (skip noisy stream_event)
-  const msgType = (msg as { type: string; subtype?: string }).type;
-  const msgSubtype = (msg as { subtype?: string }).subtype;
-  if (msgType !== 'stream_event') {
-    const subtypeStr = msgSubtype ? `, subtype=${msgSubtype}` : '';
-    console.log(`[message-mapper] ${msgType}${subtypeStr}`);
+  // stream_event is by far the most frequent type — dispatch it before any logging
+  if (msg.type === 'stream_event') {
+    return mapStreamEvent(msg.event);
   }
 
+  const msgSubtype = (msg as { subtype?: string }).subtype;
+  const subtypeStr = msgSubtype ? `, subtype=${msgSubtype}` : '';
+  console.log(`[message-mapper] ${msg.type}${subtypeStr}`);
+
   // SDK message types: system, assistant, user, result, stream_event
-  if (msg.type === 'system' && msg.subtype === 'init') {
-    return { type: 'text', sessionId: msg.session_id };
-  }
+  switch (msg.type) {
+    case 'system':
+      return mapSystemMessage(msg);
 
-  // Subagent lifecycle events
-  if (msg.type === 'system' && msg.subtype === 'task_started') {
-    const m = msg as { task_id?: string; description?: string };
-    return {
-      type: 'tool_use',
-      toolName: SUBAGENT_TOOL_NAME,
-      toolUseId: m.task_id,
-      toolInput: { description: m.description },
-    };
-  }
-  if (msg.type === 'system' && msg.subtype === 'task_progress') {
-    const m = msg as { task_id?: string; last_tool_name?: string; description?: string };
-    if (m.last_tool_name) {
-      // Try to enrich with actual tool call details from the MCP buffer
-      const verb = m.last_tool_name.replace(/^mcp__\w+__/, '');
-      const callDetails = consumeLastCall(verb);
-      const toolInput: Record<string, unknown> = { description: m.description };
-      if (callDetails) {
-        toolInput.uri = callDetails.uri;
-        if (callDetails.payload) toolInput.payload = callDetails.payload;
-      }
-      return {
-        type: 'tool_use',
-        toolName: `${SUBAGENT_TOOL_NAME}:${m.last_tool_name}`,
-        toolUseId: m.task_id,
-        toolInput,
+    case 'assistant':
+      // Don't return content here - it was already streamed via stream_event.
+      // Only return sessionId for session tracking.
+      return { type: 'text', sessionId: msg.session_id };
+
+    case 'result': {
+      // SDK result can be success or error - check for error subtypes
+      const result = msg as {
+        type: 'result';
+        subtype?: string;
+        is_error?: boolean;
+        errors?: string[];
+        session_id: string;
       };
+
+      // Check for errors (SDKResultError type)
+      if (result.is_error || result.subtype?.startsWith('error')) {
+        const errorMessage = result.errors?.join('; ') || 'Unknown SDK error';
+        console.error(`[message-mapper] SDK error: ${errorMessage} (subtype: ${result.subtype})`);
+        return { type: 'error', error: errorMessage, sessionId: result.session_id };
+      }
+
+      return { type: 'complete', sessionId: result.session_id };
     }
-    if (m.description) {
+
+    // Handle user messages containing tool results
+    case 'user':
+      return extractToolResult(msg.message);
+
+    // Skip other types
+    default:
+      return null;
+  }
+}
+
+/**
+ * Map a system message (session init and subagent lifecycle) by subtype.
+ */
+function mapSystemMessage(msg: Extract<SDKMessage, { type: 'system' }>): StreamMessage | null {
+  switch (msg.subtype) {
+    case 'init':
+      return { type: 'text', sessionId: msg.session_id };
+
+    // Subagent lifecycle events
+    case 'task_started': {
+      const m = msg as { task_id?: string; description?: string };
       return {
         type: 'tool_use',
         toolName: SUBAGENT_TOOL_NAME,
@@ -75,55 +93,49 @@ export function mapClaudeMessage(msg: SDKMessage): StreamMessage | null {
         toolInput: { description: m.description },
       };
     }
-    return null;
-  }
-  if (msg.type === 'system' && msg.subtype === 'task_notification') {
-    const m = msg as { task_id?: string; summary?: string };
-    return {
-      type: 'tool_result',
-      toolName: SUBAGENT_TOOL_NAME,
-      toolUseId: m.task_id,
-      content: m.summary ?? 'Task completed',
-    };
-  }
 
-  if (msg.type === 'assistant') {
-    // Don't return content here - it was already streamed via stream_event.
-    // Only return sessionId for session tracking.
-    return { type: 'text', sessionId: msg.session_id };
-  }
-
-  if (msg.type === 'stream_event') {
-    return mapStreamEvent(msg.event);
-  }
-
-  if (msg.type === 'result') {
-    // SDK result can be success or error - check for error subtypes
-    const result = msg as {
-      type: 'result';
-      subtype?: string;
-      is_error?: boolean;
-      errors?: string[];
-      session_id: string;
-    };
-
-    // Check for errors (SDKResultError type)
-    if (result.is_error || result.subtype?.startsWith('error')) {
-      const errorMessage = result.errors?.join('; ') || 'Unknown SDK error';
-      console.error(`[message-mapper] SDK error: ${errorMessage} (subtype: ${result.subtype})`);
-      return { type: 'error', error: errorMessage, sessionId: result.session_id };
+    case 'task_progress': {
+      const m = msg as { task_id?: string; last_tool_name?: string; description?: string };
+      if (m.last_tool_name) {
+        // Try to enrich with actual tool call details from the MCP buffer
+        const verb = m.last_tool_name.replace(/^mcp__\w+__/, '');
+        const callDetails = consumeLastCall(verb);
+        const toolInput: Record<string, unknown> = { description: m.description };
+        if (callDetails) {
+          toolInput.uri = callDetails.uri;
+          if (callDetails.payload) toolInput.payload = callDetails.payload;
+        }
+        return {
+          type: 'tool_use',
+          toolName: `${SUBAGENT_TOOL_NAME}:${m.last_tool_name}`,
+          toolUseId: m.task_id,
+          toolInput,
+        };
+      }
+      if (m.description) {
+        return {
+          type: 'tool_use',
+          toolName: SUBAGENT_TOOL_NAME,
+          toolUseId: m.task_id,
+          toolInput: { description: m.description },
+        };
+      }
+      return null;
     }
 
-    return { type: 'complete', sessionId: result.session_id };
-  }
+    case 'task_notification': {
+      const m = msg as { task_id?: string; summary?: string };
+      return {
+        type: 'tool_result',
+        toolName: SUBAGENT_TOOL_NAME,
+        toolUseId: m.task_id,
+        content: m.summary ?? 'Task completed',
+      };
+    }
 
-  // Handle user messages containing tool results
-  if (msg.type === 'user') {
-    return extractToolResult(msg.message);
+    default:
+      return null;
   }
-
-  // Skip other types
-  return null;
 }
 
 /**
@@ -139,53 +151,56 @@ function mapStreamEvent(event: unknown): StreamMessage | null {
     content_block?: unknown;
   };
 
-  if (evt.type === 'content_block_start') {
-    const block = evt.content_block as { type: string; name?: string; id?: string } | undefined;
-    if (block?.type === 'tool_use' && block.name) {
-      if (block.id) toolNameById.set(block.id, block.name);
-      const idx = evt.index ?? ++currentBlockIndex;
-      currentBlockIndex = idx;
-      // Buffer: don't emit yet — wait for input_json_delta + content_block_stop
-      pendingToolUse.set(idx, {
-        toolName: block.name,
-        toolUseId: block.id,
-        inputChunks: [],
-      });
+  switch (evt.type) {
+    case 'content_block_start': {
+      const block = evt.content_block as { type: string; name?: string; id?: string } | undefined;
+      if (block?.type === 'tool_use' && block.name) {
+        if (block.id) toolNameById.set(block.id, block.name);
+        const idx = evt.index ?? ++currentBlockIndex;
+        currentBlockIndex = idx;
+        // Buffer: don't emit yet — wait for input_json_delta + content_block_stop
+        pendingToolUse.set(idx, {
+          toolName: block.name,
+          toolUseId: block.id,
+          inputChunks: [],
+        });
+      }
       return null;
     }
-  }
 
-  if (evt.type === 'content_block_delta') {
-    const delta = evt.delta as
-      | {
-          type: string;
-          text?: string;
-          thinking?: string;
-          partial_json?: string;
-        }
-      | undefined;
-    if (!delta) return null;
+    case 'content_block_delta': {
+      const delta = evt.delta as
+        | {
+            type: string;
+            text?: string;
+            thinking?: string;
+            partial_json?: string;
+          }
+        | undefined;
+      if (!delta) return null;
 
-    if (delta.type === 'text_delta' && delta.text) {
-      return { type: 'text', content: delta.text };
-    }
-    if (delta.type === 'thinking_delta' && delta.thinking) {
-      return { type: 'thinking', content: delta.thinking };
-    }
-    if (delta.type === 'input_json_delta' && delta.partial_json) {
-      const idx = evt.index ?? currentBlockIndex;
-      const pending = pendingToolUse.get(idx);
-      if (pending) {
-        pending.inputChunks.push(delta.partial_json);
+      switch (delta.type) {
+        case 'text_delta':
+          return delta.text ? { type: 'text', content: delta.text } : null;
+        case 'thinking_delta':
+          return delta.thinking ? { type: 'thinking', content: delta.thinking } : null;
+        case 'input_json_delta':
+          if (delta.partial_json) {
+            const pending = pendingToolUse.get(evt.index ?? currentBlockIndex);
+            if (pending) {
+              pending.inputChunks.push(delta.partial_json);
+            }
+          }
+          return null;
+        default:
+          return null;
       }
-      return null;
     }
-  }
 
-  if (evt.type === 'content_block_stop') {
-    const idx = evt.index ?? currentBlockIndex;
-    const pending = pendingToolUse.get(idx);
-    if (pending) {
+    case 'content_block_stop': {
+      const idx = evt.index ?? currentBlockIndex;
+      const pending = pendingToolUse.get(idx);
+      if (!pending) return null;
       pendingToolUse.delete(idx);
       let toolInput: Record<string, unknown> | undefined;
       if (pending.inputChunks.length > 0) {
@@ -202,10 +217,11 @@ function mapStreamEvent(event: unknown): StreamMessage | null {
         toolInput,
       };
     }
-  }
 
-  // Skip other stream events
-  return null;
+    // Skip other stream events
+    default:
+      return null;
+  }
 }
 
 /**
@@ -238,28 +254,24 @@ function extractToolResult(message: unknown): StreamMessage | null {
       if (typeof toolResult.content === 'string') {
         resultText = toolResult.content;
       } else if (Array.isArray(toolResult.content)) {
-        resultText = toolResult.content
-          .filter(
-            (item): item is Record<string, unknown> => typeof item === 'object' && item !== null,
-          )
-          .map((item) => {
-            if (item.type === 'text' && typeof item.text === 'string') return item.text;
-            if (
-              item.type === 'resource' &&
-              typeof item.resource === 'object' &&
-              item.resource !== null
-            ) {
-              const res = item.resource as { text?: string; uri?: string };
-              return res.text ?? `[resource: ${res.uri}]`;
-            }
-            if (item.type === 'resource_link') {
-              const link = item as { uri?: string; name?: string };
-              return `[${link.name ?? 'link'}](${link.uri})`;
-            }
-            return '';
-          })
-          .filter(Boolean)
-          .join('');
+        // Single pass, no intermediate arrays — tool results can have many blocks
+        for (const entry of toolResult.content as unknown[]) {
+          if (typeof entry !== 'object' || entry === null) continue;
+          const item = entry as Record<string, unknown>;
+          if (item.type === 'text' && typeof item.text === 'string') {
+            resultText += item.text;
+          } else if (
+            item.type === 'resource' &&
+            typeof item.resource === 'object' &&
+            item.resource !== null
+          ) {
+            const res = item.resource as { text?: string; uri?: string };
+            resultText += res.text ?? `[resource: ${res.uri}]`;
+          } else if (item.type === 'resource_link') {
+            const link = item as { uri?: string; name?: string };
+            resultText += `[${link.name ?? 'link'}](${link.uri})`;
+          }
+        }
       }
 
       if (resultText) {
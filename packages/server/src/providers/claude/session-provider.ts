@@ -31,6 +31,49 @@ interface TextContentBlock {
 
 type ContentBlock = TextContentBlock | ImageContentBlock;
 
+/**
+ * When YAAR runs inside another Claude Code harness (e.g. cloud sandbox),
+ * the parent leaks vars that bind the child to parent-only resources (FDs,
+ * session IDs, host-managed mode). These are stripped so the spawned CLI starts clean.
+ */
+const PARENT_HARNESS_ENV_VARS = [
+  'CLAUDE_CODE_OAUTH_TOKEN_FILE_DESCRIPTOR',
+  'CLAUDE_CODE_WEBSOCKET_AUTH_FILE_DESCRIPTOR',
+  'CLAUDE_CODE_PROVIDER_MANAGED_BY_HOST',
+  'CLAUDE_CODE_SESSION_ID',
+  'CLAUDE_CODE_REMOTE_SESSION_ID',
+  'CLAUDE_CODE_CONTAINER_ID',
+  'CLAUDE_CODE_REMOTE',
+  'CLAUDECODE',
+] as const;
+
+/** Fixed env overrides applied to every spawned CLI. */
+const SDK_ENV_OVERRIDES: Readonly<Record<string, string>> = {
+  MAX_MCP_OUTPUT_TOKENS: '131072',
+  CLAUDE_CODE_DISABLE_BUILTIN_AGENTS: 'true',
+  CLAUDE_CODE_DISABLE_AUTO_MEMORY: 'true',
+  ENABLE_CLAUDEAI_MCP_SERVERS: 'false',
+};
+
+let sdkEnv: Record<string, string | undefined> | null = null;
+
+/**
+ * Environment for the spawned CLI: process.env minus parent-harness vars, plus
+ * SDK_ENV_OVERRIDES. Built once on first query (after startup has settled
+ * PORT) rather than scrubbing process.env on every query. Each caller gets its
+ * own shallow copy so a consumer mutating it can't leak into later sessions.
+ */
+function getSdkEnv(): Record<string, string | undefined> {
+  if (!sdkEnv) {
+    const env: Record<string, string | undefined> = { ...process.env };
+    for (const k of PARENT_HARNESS_ENV_VARS) {
+      delete env[k];
+    }
+    sdkEnv = { ...env, ...SDK_ENV_OVERRIDES };
+  }
+  return { ...sdkEnv };
+}
+
 export class ClaudeSessionProvider extends BaseTransport {
   readonly name = 'claude';
   readonly providerType: ProviderType = 'claude';
@@ -75,6 +118,8 @@ export class ClaudeSessionProvider extends BaseTransport {
     // This prevents the 'app' MCP server from being connected for monitor agents.
     const neededServers = new Set<string>();
     for (const tool of effectiveAllowed) {
+      // Builtin tools (WebSearch, Task, ...) can't match — skip the regex for them
+      if (!tool.startsWith('mcp__')) continue;
       const m = tool.match(/^mcp__(\w+)__/);
       if (m) neededServers.add(m[1]);
     }
@@ -96,23 +141,6 @@ export class ClaudeSessionProvider extends BaseTransport {
 
     const claudeBin = resolveClaudeBinPath();
 
-    // When YAAR runs inside another Claude Code harness (e.g. cloud sandbox),
-    // the parent leaks vars that bind the child to parent-only resources (FDs,
-    // session IDs, host-managed mode). Strip them so the spawned CLI starts clean.
-    const cleanEnv = { ...process.env };
-    for (const k of [
-      'CLAUDE_CODE_OAUTH_TOKEN_FILE_DESCRIPTOR',
-      'CLAUDE_CODE_WEBSOCKET_AUTH_FILE_DESCRIPTOR',
-      'CLAUDE_CODE_PROVIDER_MANAGED_BY_HOST',
-      'CLAUDE_CODE_SESSION_ID',
-      'CLAUDE_CODE_REMOTE_SESSION_ID',
-      'CLAUDE_CODE_CONTAINER_ID',
-      'CLAUDE_CODE_REMOTE',
-      'CLAUDECODE',
-    ]) {
-      delete cleanEnv[k];
-    }
-
     return {
       abortController: this.createAbortController(),
       executable: 'bun',
@@ -127,13 +155,7 @@ export class ClaudeSessionProvider extends BaseTransport {
       includePartialMessages: true,
       permissionMode: 'bypassPermissions',
       allowDangerouslySkipPermissions: true,
-      env: {
-        ...cleanEnv,
-        MAX_MCP_OUTPUT_TOKENS: '131072',
-        CLAUDE_CODE_DISABLE_BUILTIN_AGENTS: 'true',
-        CLAUDE_CODE_DISABLE_AUTO_MEMORY: 'true',
-        ENABLE_CLAUDEAI_MCP_SERVERS: 'false',
-      },
+      env: getSdkEnv(),
     };
   }
 
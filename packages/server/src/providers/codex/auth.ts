@@ -9,6 +9,7 @@
 import { existsSync, unlinkSync } from 'fs';
 import { join } from 'path';
 import { homedir, platform } from 'os';
+import { invalidateAvailabilityCache } from '../factory.js';
 import type { AppServer } from './app-server.js';
 import type { AccountLoginCompletedNotification } from './types.js';
 
@@ -31,6 +32,7 @@ export function invalidateCodexAuth(): void {
   try {
     if (existsSync(path)) {
       unlinkSync(path);
+      invalidateAvailabilityCache();
       console.log('[codex] Removed stale auth.json');
     }
   } catch (err) {
@@ -112,6 +114,7 @@ export async function checkAndLoginCodex(appServer: AppServer): Promise<boolean>
             clearTimeout(timeout);
             appServer.off('notification', handler);
             if (notification.success) {
+              invalidateAvailabilityCache();
               console.log('[codex] Browser login successful');
             } else {
               console.error('[codex] Browser login failed:', notification.error);
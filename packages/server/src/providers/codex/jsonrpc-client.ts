@@ -9,6 +9,7 @@
  */
 
 import { EventEmitter } from 'events';
+import { StringDecoder } from 'string_decoder';
 import type { Readable, Writable } from 'stream';
 import type {
   JsonRpcRequest,
@@ -24,8 +25,7 @@ import type {
 interface PendingRequest {
   resolve: (result: unknown) => void;
   reject: (error: Error) => void;
-  method: string;
-  timeoutId?: ReturnType<typeof setTimeout>;
+  timeoutId: ReturnType<typeof setTimeout>;
 }
 
 /**
@@ -52,7 +52,10 @@ export interface JsonRpcClientOptions {
 export class JsonRpcClient extends EventEmitter {
   private nextId = 1;
   private pendingRequests = new Map<number, PendingRequest>();
-  private buffer = '';
+  /** Stdout text received since the last complete line */
+  private pendingChunks: string[] = [];
+  /** Holds back partial UTF-8 sequences split across chunk boundaries */
+  private readonly decoder = new StringDecoder('utf8');
   private readonly requestTimeout: number;
   private closed = false;
 
@@ -95,7 +98,6 @@ export class JsonRpcClient extends EventEmitter {
       this.pendingRequests.set(id, {
         resolve: resolve as (result: unknown) => void,
         reject,
-        method,
         timeoutId,
       });
 
@@ -158,9 +160,7 @@ export class JsonRpcClient extends EventEmitter {
 
     // Reject all pending requests
     for (const [, pending] of this.pendingRequests) {
-      if (pending.timeoutId) {
-        clearTimeout(pending.timeoutId);
-      }
+      clearTimeout(pending.timeoutId);
       pending.reject(new Error('JsonRpcClient closed'));
     }
     this.pendingRequests.clear();
@@ -173,8 +173,10 @@ export class JsonRpcClient extends EventEmitter {
    */
   private setupStdoutHandler(): void {
     this.stdout.on('data', (chunk: Buffer) => {
-      this.buffer += chunk.toString();
-      this.processBuffer();
+      const text = this.decoder.write(chunk);
+      this.pendingChunks.push(text);
+      // Large messages span many chunks; only join once a line is complete
+      if (text.includes('\n')) this.processBuffer();
     });
 
     this.stdout.on('end', () => {
@@ -192,20 +194,36 @@ export class JsonRpcClient extends EventEmitter {
    * Messages are newline-delimited.
    */
   private processBuffer(): void {
+    // Walk all complete lines with a cursor; only the trailing partial line is copied.
+    // The buffer is taken over before dispatching so a throw can't replay lines.
+    const buffer = this.pendingChunks.join('');
+    const end = buffer.lastIndexOf('\n') + 1;
+    this.pendingChunks = end < buffer.length ? [buffer.slice(end)] : [];
+    let start = 0;
     let newlineIndex: number;
 
-    while ((newlineIndex = this.buffer.indexOf('\n')) !== -1) {
-      const line = this.buffer.slice(0, newlineIndex).trim();
-      this.buffer = this.buffer.slice(newlineIndex + 1);
+    while ((newlineIndex = buffer.indexOf('\n', start)) !== -1) {
+      const line = buffer.slice(start, newlineIndex).trim();
+      start = newlineIndex + 1;
 
-      if (line.length === 0) continue;
+      // JSON-RPC messages are always objects; anything else is stray log
+      // output from the process and isn't worth a JSON.parse attempt.
+      if (line.charCodeAt(0) !== 0x7b /* { */) continue;
 
+      let message: JsonRpcMessage;
       try {
-        const message = JSON.parse(line) as JsonRpcMessage;
-        this.handleMessage(message);
+        message = JSON.parse(line) as JsonRpcMessage;
       } catch {
         // Log parse errors but continue processing
         this.emit('error', new Error(`Failed to parse JSON-RPC message: ${line}`));
+        continue;
+      }
+      try {
+        this.handleMessage(message);
+      } catch (err) {
+        // A throwing listener must not escape the stdout handler
+        const detail = err instanceof Error ? err.message : String(err);
+        this.emit('error', new Error(`Error handling JSON-RPC message: ${detail}`));
       }
     }
   }
@@ -235,9 +253,7 @@ export class JsonRpcClient extends EventEmitter {
       }
 
       this.pendingRequests.delete(message.id);
-      if (pending.timeoutId) {
-        clearTimeout(pending.timeoutId);
-      }
+      clearTimeout(pending.timeoutId);
 
       // Check for error response
       if ('error' in message) {
@@ -64,8 +64,7 @@ export interface JsonRpcWsClientOptions {
 interface PendingRequest {
   resolve: (result: unknown) => void;
   reject: (error: Error) => void;
-  method: string;
-  timeoutId?: ReturnType<typeof setTimeout>;
+  timeoutId: ReturnType<typeof setTimeout>;
 }
 
 /**
@@ -93,11 +92,21 @@ export class JsonRpcWsClient {
 
     // Both NodeWebSocket and RawWebSocket emit 'message' with Buffer data
     ws.on('message', (data: Buffer) => {
+      // Decode once; parse and dispatch failures are reported separately so
+      // listener errors aren't misreported as malformed input.
+      const text = data.toString();
+      let message: JsonRpcMessage;
       try {
-        const message = JSON.parse(data.toString()) as JsonRpcMessage;
-        this.handleMessage(message);
+        message = JSON.parse(text) as JsonRpcMessage;
       } catch {
-        this.emitError(new Error(`Failed to parse JSON-RPC message: ${data.toString()}`));
+        this.emitError(new Error(`Failed to parse JSON-RPC message: ${text}`));
+        return;
+      }
+      try {
+        this.handleMessage(message);
+      } catch (err) {
+        const detail = err instanceof Error ? err.message : String(err);
+        this.emitError(new Error(`Error handling JSON-RPC message: ${detail}`));
       }
     });
 
@@ -222,7 +231,6 @@ export class JsonRpcWsClient {
       this.pendingRequests.set(id, {
         resolve: resolve as (result: unknown) => void,
         reject,
-        method,
         timeoutId,
       });
 
@@ -385,9 +393,7 @@ export class JsonRpcWsClient {
       if (!pending) return;
 
       this.pendingRequests.delete(message.id);
-      if (pending.timeoutId) {
-        clearTimeout(pending.timeoutId);
-      }
+      clearTimeout(pending.timeoutId);
 
       if ('error' in message) {
         const errorResponse = message as JsonRpcErrorResponse;
@@ -415,9 +421,7 @@ export class JsonRpcWsClient {
 
   private rejectAll(reason: string): void {
     for (const [, pending] of this.pendingRequests) {
-      if (pending.timeoutId) {
-        clearTimeout(pending.timeoutId);
-      }
+      clearTimeout(pending.timeoutId);
       pending.reject(new Error(reason));
     }
     this.pendingRequests.clear();
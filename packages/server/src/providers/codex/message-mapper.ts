@@ -28,6 +28,30 @@ type WebSearchItem = Extract<ThreadItem, { type: 'webSearch' }>;
 /** Extract the collabAgentToolCall variant from ThreadItem */
 type CollabAgentToolCallItem = Extract<ThreadItem, { type: 'collabAgentToolCall' }>;
 
+/**
+ * Noisy codex notifications with nothing to stream. Several (output deltas,
+ * progress) arrive at high rates, so they're matched with one set lookup.
+ */
+const IGNORED_NOTIFICATIONS: ReadonlySet<string> = new Set([
+  'thread/tokenUsage/updated',
+  'thread/compacted',
+  'account/rateLimits/updated',
+  'account/updated',
+  'account/login/completed',
+  'app/list/updated',
+  'model/rerouted',
+  'turn/plan/updated',
+  'turn/diff/updated',
+  'item/fileChange/outputDelta',
+  'item/commandExecution/outputDelta',
+  'item/commandExecution/terminalInteraction',
+  'item/mcpToolCall/progress',
+  'item/plan/delta',
+  'item/autoApprovalReview/started',
+  'item/autoApprovalReview/completed',
+  'rawResponseItem/completed',
+]);
+
 /** Format MCP tool name with server namespace: "apps:typecheck" */
 function mcpToolName(server?: string, tool?: string): string {
   if (server && tool) return `${server}:${tool}`;
@@ -252,27 +276,9 @@ export function mapNotification(method: string, params: unknown): StreamMessage
     default:
       // Skip noisy codex internal events
       if (
+        IGNORED_NOTIFICATIONS.has(method) ||
         method.startsWith('codex/event/') ||
-        method.startsWith('fuzzyFileSearch/') ||
-        method === 'thread/tokenUsage/updated' ||
-        method === 'thread/compacted' ||
-        method === 'account/rateLimits/updated' ||
-        method === 'account/updated' ||
-        method === 'account/login/completed' ||
-        method === 'app/list/updated' ||
-        method === 'model/rerouted' ||
-        method === 'turn/plan/updated' ||
-        method === 'turn/diff/updated' ||
-        method === 'item/fileChange/outputDelta' ||
-        method === 'item/commandExecution/outputDelta' ||
-        method === 'item/commandExecution/terminalInteraction' ||
-        method === 'item/mcpToolCall/progress' ||
-        method === 'item/reasoning/summaryTextDelta' ||
-        method === 'item/reasoning/summaryPartAdded' ||
-        method === 'item/plan/delta' ||
-        method === 'item/autoApprovalReview/started' ||
-        method === 'item/autoApprovalReview/completed' ||
-        method === 'rawResponseItem/completed'
+        method.startsWith('fuzzyFileSearch/')
       ) {
         return null;
       }
@@ -134,8 +134,11 @@ export class CodexProvider extends BaseTransport {
         actionEmitter.setCurrentAgent(options.agentId);
       }
 
-      // pendingMessages is local per-query to avoid cross-talk.
+      // pendingMessages is local per-query to avoid cross-talk. The consumer
+      // reads from readIndex and only truncates once it has caught up, so a
+      // burst of deltas isn't re-shifted one element at a time.
       const pendingMessages: StreamMessage[] = [];
+      let readIndex = 0;
       this.resolveMessage = null;
 
       const notificationHandler = (method: string, params: unknown) => {
@@ -198,20 +201,22 @@ export class CodexProvider extends BaseTransport {
         while (true) {
           if (this.isAborted()) break;
 
-          while (pendingMessages.length > 0) {
-            const message = pendingMessages.shift()!;
+          while (readIndex < pendingMessages.length) {
+            const message = pendingMessages[readIndex++];
             yield message;
 
             if (message.type === 'complete' || message.type === 'error') {
               return;
             }
           }
+          pendingMessages.length = 0;
+          readIndex = 0;
 
           const done = await new Promise<boolean>((resolve) => {
             this.resolveMessage = resolve;
           });
 
-          if (done && pendingMessages.length === 0) {
+          if (done && readIndex === pendingMessages.length) {
             break;
           }
         }
@@ -250,10 +255,15 @@ export class CodexProvider extends BaseTransport {
     // Wait for the turn to start (resolves the timing race between
     // running=true and currentTurnId being set after turn/start RPC)
     if (!this.currentTurnId && this.turnReadyPromise) {
+      let timer: ReturnType<typeof setTimeout> | undefined;
       await Promise.race([
         this.turnReadyPromise,
-        new Promise<void>((resolve) => setTimeout(resolve, 10_000)),
+        new Promise<void>((resolve) => {
+          timer = setTimeout(resolve, 10_000);
+        }),
       ]);
+      // Don't leave the fallback timer pending once the turn has started
+      clearTimeout(timer);
     }
 
     const turnId = this.currentTurnId;
@@ -44,10 +44,18 @@ export class RawWebSocket extends EventEmitter {
 
   private socket: Socket | null = null;
   private buf = Buffer.alloc(0);
+  /** Chunks received while an incomplete frame waits for `needed` bytes */
+  private pendingChunks: Buffer[] = [];
+  private pendingLength = 0;
+  private needed = 0;
   private fragments: Buffer[] = [];
   /** True once we've parsed the HTTP 101 response and switched to WS framing */
   private upgraded = false;
+  /** Offset to resume the header terminator search from (avoids rescanning) */
+  private headerScanFrom = 0;
   private wsKey = '';
+  /** Socket is corked until the next tick so same-tick frames share one write */
+  private corked = false;
 
   constructor(url: string) {
     super();
@@ -81,7 +89,18 @@ export class RawWebSocket extends EventEmitter {
     });
 
     socket.on('data', (chunk: Buffer) => {
-      this.buf = Buffer.concat([this.buf, chunk]);
+      if (this.buf.length === 0) {
+        this.buf = chunk;
+      } else {
+        // Collect chunks until the pending frame is complete, then join once,
+        // instead of re-copying the whole buffer on every chunk of a large frame.
+        this.pendingChunks.push(chunk);
+        this.pendingLength += chunk.length;
+        if (this.buf.length + this.pendingLength < this.needed) return;
+        this.buf = Buffer.concat([this.buf, ...this.pendingChunks]);
+        this.pendingChunks = [];
+        this.pendingLength = 0;
+      }
 
       if (!this.upgraded) {
         this.parseUpgradeResponse();
@@ -110,9 +129,13 @@ export class RawWebSocket extends EventEmitter {
    * Once found, switch to WebSocket frame parsing mode.
    */
   private parseUpgradeResponse(): void {
-    // Look for end of HTTP headers (\r\n\r\n)
-    const headerEnd = this.buf.indexOf('\r\n\r\n');
-    if (headerEnd === -1) return; // need more data
+    // Look for end of HTTP headers (\r\n\r\n), only in bytes not yet scanned.
+    // Back up 3 bytes so a terminator split across chunks is still found.
+    const headerEnd = this.buf.indexOf('\r\n\r\n', this.headerScanFrom);
+    if (headerEnd === -1) {
+      this.headerScanFrom = Math.max(0, this.buf.length - 3);
+      return; // need more data
+    }
 
     const headerStr = this.buf.subarray(0, headerEnd).toString('utf-8');
     const remaining = this.buf.subarray(headerEnd + 4);
@@ -165,6 +188,7 @@ export class RawWebSocket extends EventEmitter {
   // ── Frame parsing ─────────────────────────────────────────────────────
 
   private drain(): void {
+    this.needed = 2;
     while (this.buf.length >= 2) {
       const b0 = this.buf[0];
       const b1 = this.buf[1];
@@ -177,11 +201,17 @@ export class RawWebSocket extends EventEmitter {
       let offset = 2;
 
       if (payloadLen === 126) {
-        if (this.buf.length < 4) return;
+        if (this.buf.length < 4) {
+          this.needed = 4;
+          return;
+        }
         payloadLen = this.buf.readUInt16BE(2);
         offset = 4;
       } else if (payloadLen === 127) {
-        if (this.buf.length < 10) return;
+        if (this.buf.length < 10) {
+          this.needed = 10;
+          return;
+        }
         const hi = this.buf.readUInt32BE(2);
         const lo = this.buf.readUInt32BE(6);
         payloadLen = hi * 0x1_0000_0000 + lo;
@@ -191,7 +221,10 @@ export class RawWebSocket extends EventEmitter {
       if (masked) offset += 4;
 
       const total = offset + payloadLen;
-      if (this.buf.length < total) return; // need more data
+      if (this.buf.length < total) {
+        this.needed = total;
+        return; // need more data
+      }
 
       let payload = this.buf.subarray(offset, total);
 
@@ -247,46 +280,60 @@ export class RawWebSocket extends EventEmitter {
 
   // ── Frame writing (client must mask) ──────────────────────────────────
 
-  private writeFrame(opcode: number, payload: Buffer): void {
+  /**
+   * Build a masked frame in a single buffer: header, mask key, then payload.
+   * String payloads are encoded straight into the frame and masked in place.
+   */
+  private writeFrame(opcode: number, payload: string | Buffer): void {
     if (!this.socket || this.socket.destroyed) return;
 
-    const mask = randomBytes(4);
-    let header: Buffer;
-
-    if (payload.length < 126) {
-      header = Buffer.alloc(6);
-      header[0] = 0x80 | opcode;
-      header[1] = 0x80 | payload.length;
-      mask.copy(header, 2);
-    } else if (payload.length < 0x10000) {
-      header = Buffer.alloc(8);
-      header[0] = 0x80 | opcode;
-      header[1] = 0x80 | 126;
-      header.writeUInt16BE(payload.length, 2);
-      mask.copy(header, 4);
+    const length = typeof payload === 'string' ? Buffer.byteLength(payload) : payload.length;
+    const headerLength = length < 126 ? 6 : length < 0x10000 ? 8 : 14;
+    const frame = Buffer.allocUnsafe(headerLength + length);
+
+    frame[0] = 0x80 | opcode;
+    if (length < 126) {
+      frame[1] = 0x80 | length;
+    } else if (length < 0x10000) {
+      frame[1] = 0x80 | 126;
+      frame.writeUInt16BE(length, 2);
     } else {
-      header = Buffer.alloc(14);
-      header[0] = 0x80 | opcode;
-      header[1] = 0x80 | 127;
-      header.writeUInt32BE(0, 2);
-      header.writeUInt32BE(payload.length, 6);
-      mask.copy(header, 10);
+      frame[1] = 0x80 | 127;
+      frame.writeUInt32BE(0, 2);
+      frame.writeUInt32BE(length, 6);
     }
 
-    const masked = Buffer.from(payload);
-    for (let i = 0; i < masked.length; i++) {
-      masked[i] ^= mask[i & 3];
+    const mask = randomBytes(4);
+    mask.copy(frame, headerLength - 4);
+
+    if (typeof payload === 'string') {
+      frame.write(payload, headerLength, 'utf-8');
+      for (let i = headerLength; i < frame.length; i++) {
+        frame[i] ^= mask[(i - headerLength) & 3];
+      }
+    } else {
+      for (let i = 0; i < length; i++) {
+        frame[headerLength + i] = payload[i] ^ mask[i & 3];
+      }
     }
 
-    this.socket.write(Buffer.concat([header, masked]));
+    if (!this.corked) {
+      const socket = this.socket;
+      this.corked = true;
+      socket.cork();
+      process.nextTick(() => {
+        this.corked = false;
+        socket.uncork();
+      });
+    }
+    this.socket.write(frame);
   }
 
   // ── Public API (ws-module compatible) ─────────────────────────────────
 
   send(data: string | Buffer, cb?: (err?: Error) => void): void {
     try {
-      const payload = typeof data === 'string' ? Buffer.from(data, 'utf-8') : data;
-      this.writeFrame(OP_TEXT, payload);
+      this.writeFrame(OP_TEXT, data);
       cb?.();
     } catch (err) {
       const error = err instanceof Error ? err : new Error(String(err));
@@ -24,19 +24,23 @@ function getPlatformName(): string {
   }
 }
 
+/** The host OS can't change while the server runs, so resolve it once. */
+const PLATFORM_NAME = getPlatformName();
+
 function getProviderName(provider: ProviderType): string {
   return provider === 'claude' ? 'Claude' : 'Codex';
 }
 
 export async function buildEnvironmentSection(provider: ProviderType): Promise<string> {
-  const [apps, storage, settings, appHints] = await Promise.all([
+  const [apps, storage, settings, appHints, mounts] = await Promise.all([
     listApps().catch(() => []),
     storageList('').catch(() => ({ success: false as const, error: 'unavailable' })),
     readSettings(),
     loadAllAppHints().catch(() => []),
+    loadMounts(),
   ]);
 
-  const lines = [`- Platform: ${getPlatformName()}`, `- Provider: ${getProviderName(provider)}`];
+  const lines = [`- Platform: ${PLATFORM_NAME}`, `- Provider: ${getProviderName(provider)}`];
   if (settings.userName) lines.push(`- User: ${settings.userName}`);
   lines.push(`- Language: ${getLanguageLabel(settings.language)} (${settings.language})`);
 
@@ -69,7 +73,6 @@ export async function buildEnvironmentSection(provider: ProviderType): Promise<s
     lines.push('- Storage: empty');
   }
 
-  const mounts = await loadMounts();
   if (mounts.length > 0) {
     const mountLines = mounts.map(
       (m) => `  - mounts/${m.alias}/ \u2192 ${m.hostPath}${m.readOnly ? ' (read-only)' : ''}`,
@@ -7,6 +7,8 @@
 import type { AITransport, ProviderType, ProviderInfo } from './types.js';
 import { getWarmPool } from './warm-pool.js';
 import { getForcedProvider } from './get-forced-provider.js';
+import { probeCliVersion } from './base-transport.js';
+import { clearCliPathCache } from '../config.js';
 
 /**
  * Registry of available providers with metadata.
@@ -41,62 +43,110 @@ const availabilityCheckers: Record<ProviderType, () => Promise<boolean>> = {
     const { ClaudeSessionProvider } = await import('./claude/index.js');
     const p = new ClaudeSessionProvider();
     try {
-      return await p.isAvailable();
+      const available = await p.isAvailable();
+      // The probe may have spawned a cached path that has since moved
+      if (!available) clearCliPathCache('claude');
+      return available;
     } finally {
       await p.dispose();
     }
   },
   codex: async () => {
-    // Check CLI + auth without needing an AppServer
+    // Check auth + CLI without needing an AppServer
     // Passive check only — must NOT block with login (called by GET /api/providers)
-    try {
-      const { getCodexSpawnArgs } = await import('../config.js');
-      const result = Bun.spawnSync([...getCodexSpawnArgs(), '--version'], {
-        stdio: ['ignore', 'ignore', 'ignore'],
-      });
-      if (result.exitCode !== 0) return false;
-    } catch {
-      return false;
-    }
+    // Auth is a single stat, so check it before paying for a process spawn
     const { hasCodexAuth } = await import('./codex/auth.js');
-    return hasCodexAuth();
+    if (!hasCodexAuth()) return false;
+    const { getCodexSpawnArgs } = await import('../config.js');
+    if (await probeCliVersion(getCodexSpawnArgs())) return true;
+    clearCliPathCache('codex');
+    return false;
   },
 };
 
 /**
- * Get list of available provider names.
+ * How long a positive availability result is reused. Each check spawns a CLI
+ * process, and an installed, authenticated CLI rarely disappears within seconds.
+ * Negative results aren't cached, so a login or install is picked up immediately;
+ * logouts and settings changes call invalidateAvailabilityCache().
  */
-export async function getAvailableProviders(): Promise<ProviderType[]> {
-  const available: ProviderType[] = [];
+const AVAILABILITY_TTL_MS = 30_000;
 
-  for (const providerType of PROVIDER_PREFERENCE) {
-    const checker = availabilityCheckers[providerType];
-    if (!checker) continue;
+/** Cached availability checks; storing the promise also dedupes concurrent probes. */
+const availabilityCache = new Map<ProviderType, { checkedAt: number; result: Promise<boolean> }>();
 
-    if (await checker()) {
-      available.push(providerType);
-    }
+/**
+ * Drop cached availability results so the next check re-probes the CLIs.
+ * Called after a login/logout or a provider change in settings.
+ */
+export function invalidateAvailabilityCache(): void {
+  availabilityCache.clear();
+}
+
+function isProviderAvailable(providerType: ProviderType): Promise<boolean> {
+  const cached = availabilityCache.get(providerType);
+  if (cached && Date.now() - cached.checkedAt < AVAILABILITY_TTL_MS) {
+    return cached.result;
   }
 
-  return available;
+  const checker = availabilityCheckers[providerType];
+  if (!checker) return Promise.resolve(false);
+
+  const result = checker();
+  availabilityCache.set(providerType, { checkedAt: Date.now(), result });
+  // Keep only positive results; a missing or logged-out CLI is re-probed next time
+  const evict = () => {
+    if (availabilityCache.get(providerType)?.result === result) {
+      availabilityCache.delete(providerType);
+    }
+  };
+  result.then((available) => {
+    if (!available) evict();
+  }, evict);
+  return result;
 }
 
 /**
- * Create a provider instance by provider type.
- * Claude: creates directly. Codex: uses warm pool (AppServer required).
+ * Run the availability checks for the given providers concurrently.
+ * Results are returned in the same order as `providers`.
  */
-export async function createProvider(providerType: ProviderType): Promise<AITransport> {
-  if (providerType === 'claude') {
+function checkAvailability(providers: readonly ProviderType[]): Promise<boolean[]> {
+  return Promise.all(providers.map(isProviderAvailable));
+}
+
+/**
+ * Get list of available provider names.
+ */
+export async function getAvailableProviders(): Promise<ProviderType[]> {
+  const results = await checkAvailability(PROVIDER_PREFERENCE);
+  return PROVIDER_PREFERENCE.filter((_, i) => results[i]);
+}
+
+/**
+ * Provider constructors, keyed like availabilityCheckers so every
+ * ProviderType must have an entry. SDK modules are still imported lazily.
+ */
+const providerFactories: Record<ProviderType, () => Promise<AITransport>> = {
+  claude: async () => {
     const { ClaudeSessionProvider } = await import('./claude/index.js');
     return new ClaudeSessionProvider();
-  }
-  if (providerType === 'codex') {
+  },
+  codex: async () => {
     // Codex providers must go through the warm pool (which owns the AppServer)
     const provider = await getWarmPool().acquire();
     if (!provider) throw new Error('Failed to create Codex provider');
     return provider;
-  }
-  throw new Error(`Unknown provider: ${providerType}`);
+  },
+};
+
+/**
+ * Create a provider instance by provider type.
+ * Claude: creates directly. Codex: uses warm pool (AppServer required).
+ */
+export async function createProvider(providerType: ProviderType): Promise<AITransport> {
+  const factory = providerFactories[providerType];
+  if (!factory) throw new Error(`Unknown provider: ${providerType}`);
+  return factory();
 }
 
 /**
@@ -108,16 +158,10 @@ export async function getFirstAvailableProvider(): Promise<AITransport | null> {
   const forcedProvider = getForcedProvider();
   const providers = forcedProvider ? [forcedProvider] : PROVIDER_PREFERENCE;
 
-  for (const providerType of providers) {
-    const checker = availabilityCheckers[providerType];
-    if (!checker) continue;
-
-    if (await checker()) {
-      return createProvider(providerType);
-    }
-  }
-
-  return null;
+  // Check all candidates at once, but still honor preference order
+  const results = await checkAvailability(providers);
+  const index = results.indexOf(true);
+  return index === -1 ? null : createProvider(providers[index]);
 }
 
 /**
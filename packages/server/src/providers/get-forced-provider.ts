@@ -8,6 +8,12 @@ import { join } from 'path';
 import type { ProviderType } from './types.js';
 import { getConfigDir } from '../config.js';
 
+const PROVIDER_TYPES: ReadonlySet<string> = new Set<ProviderType>(['claude', 'codex']);
+
+function isProviderType(value: unknown): value is ProviderType {
+  return typeof value === 'string' && PROVIDER_TYPES.has(value);
+}
+
 /**
  * Get forced provider from environment variable or config/settings.json.
  * Priority: PROVIDER env var > settings.json provider field > auto-detect (null).
@@ -15,7 +21,7 @@ import { getConfigDir } from '../config.js';
 export function getForcedProvider(): ProviderType | null {
   // 1. Check environment variable
   const envProvider = process.env.PROVIDER?.toLowerCase();
-  if (envProvider && (envProvider === 'claude' || envProvider === 'codex')) {
+  if (isProviderType(envProvider)) {
     return envProvider;
   }
 
@@ -25,7 +31,7 @@ export function getForcedProvider(): ProviderType | null {
     const raw = readFileSync(settingsPath, 'utf-8');
     const parsed = JSON.parse(raw);
     const settingsProvider = parsed.provider;
-    if (settingsProvider === 'claude' || settingsProvider === 'codex') {
+    if (isProviderType(settingsProvider)) {
       return settingsProvider;
     }
   } catch {
@@ -22,12 +22,15 @@ interface ConnectionEntry {
 
 export class BroadcastCenter {
   private connections: Map<ConnectionId, ConnectionEntry> = new Map();
+  /** Bumped whenever a connection or monitor subscription is added. */
+  private subscriptionEpoch = 0;
 
   /**
    * Register a WebSocket connection with its session.
    */
   subscribe(connectionId: ConnectionId, ws: YaarWebSocket, sessionId: SessionId): void {
     this.connections.set(connectionId, { ws, sessionId, subscribedMonitors: new Set() });
+    this.subscriptionEpoch++;
     console.log(`[BroadcastCenter] Connection subscribed: ${connectionId} (session: ${sessionId})`);
   }
 
@@ -48,12 +51,21 @@ export class BroadcastCenter {
     const entry = this.connections.get(connectionId);
     if (entry) {
       entry.subscribedMonitors.add(monitorId);
+      this.subscriptionEpoch++;
       console.log(
         `[BroadcastCenter] Connection ${connectionId} subscribed to monitor ${monitorId}`,
       );
     }
   }
 
+  /**
+   * Counter that changes whenever a connection may have started receiving events
+   * mid-stream. Streams sent as deltas compare it to resend their full text.
+   */
+  getSubscriptionEpoch(): number {
+    return this.subscriptionEpoch;
+  }
+
   /**
    * Check if a connection is still active.
    */
@@ -88,11 +100,11 @@ export class BroadcastCenter {
    */
   publishToSession(sessionId: SessionId, event: ServerEvent): number {
     let count = 0;
-    const data = JSON.stringify(event);
+    let data: string | undefined; // encoded on first recipient
     for (const [, entry] of this.connections) {
       if (entry.sessionId === sessionId && entry.ws.readyState === WS_OPEN) {
         try {
-          entry.ws.send(data);
+          entry.ws.send((data ??= JSON.stringify(event)));
           count++;
         } catch (err) {
           console.error(`[BroadcastCenter] Failed to send session event:`, err);
@@ -109,13 +121,13 @@ export class BroadcastCenter {
    */
   publishToMonitor(sessionId: SessionId, monitorId: string, event: ServerEvent): number {
     let count = 0;
-    const data = JSON.stringify(event);
+    let data: string | undefined; // encoded on first recipient
     for (const [, entry] of this.connections) {
       if (entry.sessionId === sessionId && entry.ws.readyState === WS_OPEN) {
         // Send if: no subscriptions (backward compat) OR subscribed to this monitor
         if (entry.subscribedMonitors.size === 0 || entry.subscribedMonitors.has(monitorId)) {
           try {
-            entry.ws.send(data);
+            entry.ws.send((data ??= JSON.stringify(event)));
             count++;
           } catch (err) {
             console.error(`[BroadcastCenter] Failed to send monitor event:`, err);
@@ -132,11 +144,11 @@ export class BroadcastCenter {
    */
   broadcast(event: ServerEvent): number {
     let count = 0;
-    const data = JSON.stringify(event);
+    let data: string | undefined; // encoded on first recipient
     for (const [, entry] of this.connections) {
       if (entry.ws.readyState === WS_OPEN) {
         try {
-          entry.ws.send(data);
+          entry.ws.send((data ??= JSON.stringify(event)));
           count++;
         } catch (err) {
           console.error(`[BroadcastCenter] Failed to broadcast:`, err);
@@ -113,6 +113,7 @@ mock.module('../providers/factory.js', () => ({
   getFirstAvailableProvider: mock(async () => null),
   getProviderInfo: mock(() => undefined),
   getAllProviderInfo: mock(() => []),
+  invalidateAvailabilityCache: mock(() => {}),
   initWarmPool: mock(async () => {}),
   acquireWarmProvider: mock(() => Promise.resolve(null)),
   getWarmPool: () => ({ resetCodexProviders: mock(() => {}) }),
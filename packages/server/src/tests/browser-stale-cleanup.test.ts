@@ -5,7 +5,7 @@
  * These test the actual (unmocked) functions from chrome.ts to verify
  * the cleanup logic works end-to-end.
  */
-import { describe, it, expect, beforeEach, afterEach } from 'bun:test';
+import { describe, it, expect, beforeAll, afterEach } from 'bun:test';
 import { writeFile, readFile, mkdir, rm, stat } from 'fs/promises';
 import { tmpdir } from 'os';
 import { join } from 'path';
@@ -27,8 +27,8 @@ async function fileExists(path: string): Promise<boolean> {
 // ── Tests ────────────────────────────────────────────────────────────────────
 
 describe('stale Chrome cleanup', () => {
-  // Clean up test artifacts
-  beforeEach(async () => {
+  // Clear leftovers from an earlier run once; afterEach keeps every test clean
+  beforeAll(async () => {
     await rm(PID_FILE, { force: true });
   });
   afterEach(async () => {
@@ -0,0 +1,85 @@
+import { describe, it, expect } from 'bun:test';
+import type { SDKMessage } from '@anthropic-ai/claude-agent-sdk';
+import { mapClaudeMessage } from '../providers/claude/message-mapper.js';
+
+/** Wrap a raw Anthropic stream event the way the SDK delivers it. */
+function streamEvent(event: Record<string, unknown>): SDKMessage {
+  return { type: 'stream_event', event } as unknown as SDKMessage;
+}
+
+describe('mapClaudeMessage stream events', () => {
+  it('maps text and thinking deltas', () => {
+    expect(
+      mapClaudeMessage(
+        streamEvent({ type: 'content_block_delta', delta: { type: 'text_delta', text: 'hi' } }),
+      ),
+    ).toEqual({ type: 'text', content: 'hi' });
+    expect(
+      mapClaudeMessage(
+        streamEvent({
+          type: 'content_block_delta',
+          delta: { type: 'thinking_delta', thinking: 'hmm' },
+        }),
+      ),
+    ).toEqual({ type: 'thinking', content: 'hmm' });
+  });
+
+  it('buffers tool input until the block stops', () => {
+    const start = streamEvent({
+      type: 'content_block_start',
+      index: 3,
+      content_block: { type: 'tool_use', name: 'mcp__verbs__read', id: 'tu-1' },
+    });
+    const part = (partial_json: string) =>
+      streamEvent({
+        type: 'content_block_delta',
+        index: 3,
+        delta: { type: 'input_json_delta', partial_json },
+      });
+
+    expect(mapClaudeMessage(start)).toBeNull();
+    expect(mapClaudeMessage(part('{"uri":"yaar:'))).toBeNull();
+    expect(mapClaudeMessage(part('//apps"}'))).toBeNull();
+    expect(mapClaudeMessage(streamEvent({ type: 'content_block_stop', index: 3 }))).toEqual({
+      type: 'tool_use',
+      toolName: 'mcp__verbs__read',
+      toolUseId: 'tu-1',
+      toolInput: { uri: 'yaar://apps' },
+    });
+  });
+
+  it('skips unrelated stream events', () => {
+    expect(mapClaudeMessage(streamEvent({ type: 'message_start' }))).toBeNull();
+    expect(mapClaudeMessage(streamEvent({ type: 'content_block_stop', index: 99 }))).toBeNull();
+  });
+});
+
+describe('mapClaudeMessage tool results', () => {
+  it('joins text, resource and link blocks from a tool result', () => {
+    const msg = {
+      type: 'user',
+      message: {
+        role: 'user',
+        content: [
+          {
+            type: 'tool_result',
+            tool_use_id: 'tu-2',
+            content: [
+              { type: 'text', text: 'a' },
+              { type: 'resource', resource: { uri: 'yaar://x' } },
+              { type: 'resource_link', name: 'doc', uri: 'yaar://doc' },
+              { type: 'image' },
+            ],
+          },
+        ],
+      },
+    } as unknown as SDKMessage;
+
+    expect(mapClaudeMessage(msg)).toEqual({
+      type: 'tool_result',
+      toolName: 'mcp_tool',
+      content: 'a[resource: yaar://x][doc](yaar://doc)',
+      toolUseId: 'tu-2',
+    });
+  });
+});
@@ -0,0 +1,95 @@
+import { describe, it, expect } from 'bun:test';
+import { PassThrough } from 'stream';
+import { JsonRpcClient } from '../providers/codex/jsonrpc-client.js';
+
+function createClient() {
+  const stdin = new PassThrough();
+  const stdout = new PassThrough();
+  const client = new JsonRpcClient(stdin, stdout);
+  const notifications: Array<{ method: string; params: unknown }> = [];
+  client.on('notification', (method: string, params: unknown) => {
+    notifications.push({ method, params });
+  });
+  return { client, stdout, notifications };
+}
+
+/** Wait for queued stream 'data' events to be delivered. */
+const flush = () => new Promise((r) => setTimeout(r, 0));
+
+describe('JsonRpcClient stdout parsing', () => {
+  it('parses several newline-delimited messages from one chunk', async () => {
+    const { stdout, notifications } = createClient();
+
+    stdout.write(
+      '{"jsonrpc":"2.0","method":"a","params":{"n":1}}\n{"jsonrpc":"2.0","method":"b"}\n',
+    );
+    await flush();
+
+    expect(notifications.map((n) => n.method)).toEqual(['a', 'b']);
+    expect(notifications[0].params).toEqual({ n: 1 });
+  });
+
+  it('reassembles a message split across chunks', async () => {
+    const { stdout, notifications } = createClient();
+
+    stdout.write('{"jsonrpc":"2.0",');
+    stdout.write('"method":"item/agentMessage/delta",');
+    await flush();
+    expect(notifications).toHaveLength(0);
+
+    stdout.write('"params":{"delta":"hi"}}\n{"jsonrpc":"2.0"');
+    await flush();
+    expect(notifications).toEqual([{ method: 'item/agentMessage/delta', params: { delta: 'hi' } }]);
+  });
+
+  it('keeps multi-byte characters intact across chunk boundaries', async () => {
+    const { stdout, notifications } = createClient();
+    const bytes = Buffer.from('{"jsonrpc":"2.0","method":"m","params":{"text":"안녕"}}\n');
+    const split = bytes.indexOf(Buffer.from('안')) + 1; // inside the first character
+
+    stdout.write(bytes.subarray(0, split));
+    stdout.write(bytes.subarray(split));
+    await flush();
+
+    expect(notifications).toEqual([{ method: 'm', params: { text: '안녕' } }]);
+  });
+
+  it('ignores non-JSON output lines without reporting errors', async () => {
+    const { client, stdout, notifications } = createClient();
+    const errors: Error[] = [];
+    client.on('error', (err: Error) => errors.push(err));
+
+    stdout.write('WARN something happened\n\n{"jsonrpc":"2.0","method":"ok"}\n');
+    await flush();
+
+    expect(errors).toHaveLength(0);
+    expect(notifications.map((n) => n.method)).toEqual(['ok']);
+  });
+
+  it('reports malformed lines and keeps going', async () => {
+    const { client, stdout, notifications } = createClient();
+    const errors: Error[] = [];
+    client.on('error', (err: Error) => errors.push(err));
+
+    stdout.write('{not json}\n{"jsonrpc":"2.0","method":"ok"}\n');
+    await flush();
+
+    expect(errors).toHaveLength(1);
+    expect(notifications.map((n) => n.method)).toEqual(['ok']);
+  });
+
+  it('reports a throwing notification listener instead of letting it escape', async () => {
+    const { client, stdout, notifications } = createClient();
+    const errors: Error[] = [];
+    client.on('error', (err: Error) => errors.push(err));
+    client.prependListener('notification', (method: string) => {
+      if (method === 'bad') throw new Error('boom');
+    });
+
+    stdout.write('{"jsonrpc":"2.0","method":"bad"}\n{"jsonrpc":"2.0","method":"ok"}\n');
+    await flush();
+
+    expect(errors.map((e) => e.message)).toEqual(['Error handling JSON-RPC message: boom']);
+    expect(notifications.map((n) => n.method)).toEqual(['ok']);
+  });
+});
@@ -1,30 +1,7 @@
-import { mock, setSystemTime, describe, it, expect, beforeEach } from 'bun:test';
-
-mock.module('../config.js', () => ({
-  getEnvInt: (key: string, def: number) => def,
-  IS_BUNDLED_EXE: false,
-  PROJECT_ROOT: '/mock-root',
-  getStorageDir: () => '/tmp/mock-storage',
-  STORAGE_DIR: '/tmp/mock-storage',
-  getConfigDir: () => '/tmp/mock-config',
-  getFrontendDist: () => '/tmp/mock-dist',
-  FRONTEND_DIST: '/tmp/mock-dist',
-  MIME_TYPES: {},
-  MAX_UPLOAD_SIZE: 50 * 1024 * 1024,
-  getPort: () => 8000,
-  setPort: () => {},
-  IS_REMOTE: false,
-  MARKET_URL: 'https://yaarmarket.vercel.app',
-  MONITOR_MAX_CONCURRENT: 2,
-  MONITOR_MAX_ACTIONS_PER_MIN: 10,
-  MONITOR_MAX_OUTPUT_PER_MIN: 10000,
-  resolveClaudeBinPath: () => null,
-  getClaudeSpawnArgs: () => [],
-  getCodexSpawnArgs: () => [],
-  CODEX_WS_PORT: 4510,
-  getCodexWsPort: () => 4510,
-  getCodexAppServerArgs: () => [],
-}));
+import { setSystemTime, describe, it, expect, beforeEach } from 'bun:test';
+import { mockConfig } from './test-utils.js';
+
+mockConfig({ MONITOR_MAX_ACTIONS_PER_MIN: 10, MONITOR_MAX_OUTPUT_PER_MIN: 10000 });
 
 const { MonitorBudgetPolicy } =
   await import('../agents/context-pool-policies/monitor-budget-policy.js');
@@ -28,6 +28,7 @@ mock.module('../providers/factory.js', () => ({
   getFirstAvailableProvider: mock(async () => null),
   getProviderInfo: mock(() => undefined),
   getAllProviderInfo: mock(() => []),
+  invalidateAvailabilityCache: mock(() => {}),
   initWarmPool: mock(async () => {}),
   acquireWarmProvider: mock(async () => createMockProvider()),
   getWarmPool: () => ({ resetCodexProviders: mock(() => {}) }),
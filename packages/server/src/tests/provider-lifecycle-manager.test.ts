@@ -0,0 +1,102 @@
+import { describe, it, expect, mock, beforeEach } from 'bun:test';
+import type { ServerEvent } from '@yaar/shared';
+import type { AITransport, ProviderType } from '../providers/types.js';
+
+function createMockProvider(providerType: ProviderType, available = true) {
+  return {
+    name: providerType,
+    providerType,
+    systemPrompt: '',
+    isAvailable: mock(async () => available),
+    query: mock(() => {}),
+    interrupt: mock(() => {}),
+    dispose: mock(async () => {}),
+  };
+}
+
+const mockGetAvailableProviders = mock(async (): Promise<ProviderType[]> => ['claude', 'codex']);
+const mockCreateProvider = mock(
+  async (type: ProviderType) => createMockProvider(type) as unknown as AITransport,
+);
+
+mock.module('../providers/factory.js', () => ({
+  providerRegistry: {},
+  getAvailableProviders: mockGetAvailableProviders,
+  createProvider: mockCreateProvider,
+  getFirstAvailableProvider: mock(async () => null),
+  getProviderInfo: mock(() => undefined),
+  getAllProviderInfo: mock(() => []),
+  invalidateAvailabilityCache: mock(() => {}),
+  initWarmPool: mock(async () => {}),
+  acquireWarmProvider: mock(() => Promise.resolve(null)),
+  getWarmPool: () => ({ resetCodexProviders: mock(() => {}) }),
+}));
+
+const { ProviderLifecycleManager } = await import(
+  '../agents/session-policies/provider-lifecycle-manager.js'
+);
+
+function createManager(provider: ReturnType<typeof createMockProvider>) {
+  const events: ServerEvent[] = [];
+  const state = {
+    provider: provider as unknown as AITransport,
+    sessionId: 'thread-1',
+    hasProcessedFirstUserTurn: true,
+    sessionLogger: null,
+  };
+  const manager = new ProviderLifecycleManager(state, async (event) => {
+    events.push(event);
+  });
+  return { manager, state, events };
+}
+
+describe('ProviderLifecycleManager.setProvider', () => {
+  beforeEach(() => {
+    mockGetAvailableProviders.mockClear();
+    mockCreateProvider.mockClear();
+  });
+
+  it('keeps a working provider of the same type and its session', async () => {
+    const current = createMockProvider('codex');
+    const { manager, state, events } = createManager(current);
+
+    await manager.setProvider('codex');
+
+    expect(current.dispose).not.toHaveBeenCalled();
+    expect(mockCreateProvider).not.toHaveBeenCalled();
+    expect(state.provider).toBe(current as unknown as AITransport);
+    expect(state.sessionId).toBe('thread-1');
+    expect(events).toEqual([
+      expect.objectContaining({ type: 'CONNECTION_STATUS', status: 'connected' }),
+    ]);
+  });
+
+  it('replaces a dead provider of the same type', async () => {
+    const current = createMockProvider('codex', false);
+    const { manager, state } = createManager(current);
+
+    await manager.setProvider('codex');
+
+    expect(current.dispose).toHaveBeenCalledTimes(1);
+    expect(mockCreateProvider).toHaveBeenCalledWith('codex');
+    expect(state.provider).not.toBe(current as unknown as AITransport);
+    expect(state.sessionId).toBeNull();
+    expect(state.hasProcessedFirstUserTurn).toBe(false);
+  });
+
+  it('switches to a different provider type and starts a fresh session', async () => {
+    const current = createMockProvider('claude');
+    const { manager, state, events } = createManager(current);
+
+    await manager.setProvider('codex');
+
+    expect(current.dispose).toHaveBeenCalledTimes(1);
+    expect(mockCreateProvider).toHaveBeenCalledWith('codex');
+    expect(state.provider?.providerType).toBe('codex');
+    expect(state.sessionId).toBeNull();
+    expect(state.hasProcessedFirstUserTurn).toBe(false);
+    expect(events.at(-1)).toEqual(
+      expect.objectContaining({ type: 'CONNECTION_STATUS', provider: 'codex' }),
+    );
+  });
+});
@@ -0,0 +1,82 @@
+import { describe, it, expect } from 'bun:test';
+import type { ServerEvent } from '@yaar/shared';
+import {
+  StreamToEventMapper,
+  type StreamMappingState,
+} from '../agents/session-policies/stream-to-event-mapper.js';
+import { monitorSource } from '../agents/context.js';
+import { getBroadcastCenter } from '../session/broadcast-center.js';
+
+function createMapper() {
+  const events: ServerEvent[] = [];
+  const state: StreamMappingState = { responseText: '', thinkingText: '', currentMessageId: null };
+  const mapper = new StreamToEventMapper(
+    'main',
+    'test',
+    state,
+    async (event) => {
+      events.push(event);
+    },
+    null,
+    monitorSource('0'),
+  );
+  return { mapper, state, events };
+}
+
+describe('StreamToEventMapper streaming', () => {
+  it('sends response text as deltas after the first chunk', async () => {
+    const { mapper, state, events } = createMapper();
+
+    await mapper.map({ type: 'text', content: 'Hello' });
+    await mapper.map({ type: 'text', content: ', world' });
+
+    expect(state.responseText).toBe('Hello, world');
+    expect(events).toEqual([
+      expect.objectContaining({ type: 'AGENT_RESPONSE', content: 'Hello', isDelta: false }),
+      expect.objectContaining({ type: 'AGENT_RESPONSE', content: ', world', isDelta: true }),
+    ]);
+  });
+
+  it('resends the full response when a connection subscribes mid-stream', async () => {
+    const { mapper, events } = createMapper();
+    const ws = { readyState: 3, send: () => {} };
+
+    await mapper.map({ type: 'text', content: 'Hello' });
+    getBroadcastCenter().subscribe('conn-late', ws, 'session-late');
+    await mapper.map({ type: 'text', content: ', world' });
+    await mapper.map({ type: 'text', content: '!' });
+    getBroadcastCenter().unsubscribe('conn-late');
+
+    expect(events.slice(1)).toEqual([
+      expect.objectContaining({ content: 'Hello, world', isDelta: false }),
+      expect.objectContaining({ content: '!', isDelta: true }),
+    ]);
+  });
+
+  it('resends the full response after switching back from thinking', async () => {
+    const { mapper, events } = createMapper();
+
+    await mapper.map({ type: 'text', content: 'Part one. ' });
+    await mapper.map({ type: 'thinking', content: 'hmm' });
+    await mapper.map({ type: 'text', content: 'Part two.' });
+
+    const responses = events.filter((e) => e.type === 'AGENT_RESPONSE');
+    expect(responses.at(-1)).toEqual(
+      expect.objectContaining({ content: 'Part one. Part two.', isDelta: false }),
+    );
+  });
+
+  it('flushes throttled thinking as a delta', async () => {
+    const { mapper, events } = createMapper();
+
+    await mapper.map({ type: 'thinking', content: 'a' });
+    await mapper.map({ type: 'thinking', content: 'b' }); // throttled
+    await mapper.map({ type: 'text', content: 'done' });
+
+    const thinking = events.filter((e) => e.type === 'AGENT_THINKING');
+    expect(thinking).toEqual([
+      expect.objectContaining({ content: 'a', isDelta: false }),
+      expect.objectContaining({ content: 'b', isDelta: true }),
+    ]);
+  });
+});
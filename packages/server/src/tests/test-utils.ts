@@ -0,0 +1,40 @@
+/**
+ * Shared helpers for server tests.
+ */
+import { mock } from 'bun:test';
+
+/** Stand-in for ../config.js: fixed paths, default limits, no CLI discovery. */
+const CONFIG_DEFAULTS = {
+  getEnvInt: (_key: string, def: number) => def,
+  IS_BUNDLED_EXE: false,
+  PROJECT_ROOT: '/mock-root',
+  getStorageDir: () => '/tmp/mock-storage',
+  STORAGE_DIR: '/tmp/mock-storage',
+  getConfigDir: () => '/tmp/mock-config',
+  getFrontendDist: () => '/tmp/mock-dist',
+  FRONTEND_DIST: '/tmp/mock-dist',
+  MIME_TYPES: {},
+  MAX_UPLOAD_SIZE: 50 * 1024 * 1024,
+  getPort: () => 8000,
+  setPort: () => {},
+  IS_REMOTE: false,
+  MARKET_URL: 'https://yaarmarket.vercel.app',
+  MONITOR_MAX_CONCURRENT: 2,
+  MONITOR_MAX_ACTIONS_PER_MIN: 30,
+  MONITOR_MAX_OUTPUT_PER_MIN: 50000,
+  clearCliPathCache: () => {},
+  resolveClaudeBinPath: () => null,
+  getClaudeSpawnArgs: () => [],
+  getCodexSpawnArgs: () => [],
+  CODEX_WS_PORT: 4510,
+  getCodexWsPort: () => 4510,
+  getCodexAppServerArgs: () => [],
+};
+
+/**
+ * Mock ../config.js in one call. Pass overrides for the values a test
+ * depends on; everything else keeps the defaults above.
+ */
+export function mockConfig(overrides: Partial<typeof CONFIG_DEFAULTS> = {}): void {
+  mock.module('../config.js', () => ({ ...CONFIG_DEFAULTS, ...overrides }));
+}
@@ -0,0 +1,61 @@
+import { describe, it, expect } from 'bun:test';
+import type { OSAction, ServerEvent } from '@yaar/shared';
+import { ToolActionBridge } from '../agents/session-policies/tool-action-bridge.js';
+
+function createBridge() {
+  const events: ServerEvent[] = [];
+  const bridge = new ToolActionBridge(
+    { currentRole: 'main' },
+    async (event) => {
+      events.push(event);
+    },
+    () => 'agent-1',
+    () => null,
+    () => {},
+  );
+  return { bridge, events };
+}
+
+const closeAction = (windowId: string) => ({ type: 'window.close', windowId }) as OSAction;
+
+describe('ToolActionBridge', () => {
+  it('coalesces actions emitted in the same tick into one ACTIONS event', async () => {
+    const { bridge, events } = createBridge();
+
+    await Promise.all([
+      bridge.handleToolAction({ action: closeAction('w1') }),
+      bridge.handleToolAction({ action: closeAction('w2') }),
+    ]);
+
+    expect(events).toHaveLength(1);
+    expect(events[0]).toEqual(
+      expect.objectContaining({
+        type: 'ACTIONS',
+        actions: [
+          expect.objectContaining({ windowId: 'w1' }),
+          expect.objectContaining({ windowId: 'w2' }),
+        ],
+      }),
+    );
+  });
+
+  it('keeps actions for different monitors in separate events, in order', async () => {
+    const { bridge, events } = createBridge();
+
+    await Promise.all([
+      bridge.handleToolAction({ action: closeAction('w1'), monitorId: '0' }),
+      bridge.handleToolAction({ action: closeAction('w2'), monitorId: '1' }),
+    ]);
+
+    expect(events.map((e) => (e as { monitorId?: string }).monitorId)).toEqual(['0', '1']);
+  });
+
+  it('sends actions from separate ticks separately', async () => {
+    const { bridge, events } = createBridge();
+
+    await bridge.handleToolAction({ action: closeAction('w1') });
+    await bridge.handleToolAction({ action: closeAction('w2') });
+
+    expect(events).toHaveLength(2);
+  });
+});
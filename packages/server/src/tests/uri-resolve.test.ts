@@ -6,6 +6,7 @@
  * with a single test that validates the actual routing layer.
  */
 import { mock, describe, it, expect } from 'bun:test';
+import { mockConfig } from './test-utils.js';
 
 // Mock server dependencies that resolveUri imports
 mock.module('../storage/storage-manager.js', () => ({
@@ -27,31 +28,7 @@ mock.module('../storage/storage-manager.js', () => ({
   storageDelete: mock(async () => ({ success: true })),
   storageGrep: mock(async () => ({ success: true, matches: [] })),
 }));
-mock.module('../config.js', () => ({
-  getEnvInt: (key: string, def: number) => def,
-  IS_BUNDLED_EXE: false,
-  PROJECT_ROOT: '/mock-root',
-  getStorageDir: () => '/tmp/mock-storage',
-  STORAGE_DIR: '/tmp/mock-storage',
-  getConfigDir: () => '/tmp/mock-config',
-  getFrontendDist: () => '/tmp/mock-dist',
-  FRONTEND_DIST: '/tmp/mock-dist',
-  MIME_TYPES: {},
-  MAX_UPLOAD_SIZE: 50 * 1024 * 1024,
-  getPort: () => 8000,
-  setPort: () => {},
-  IS_REMOTE: false,
-  MARKET_URL: 'https://yaarmarket.vercel.app',
-  MONITOR_MAX_CONCURRENT: 2,
-  MONITOR_MAX_ACTIONS_PER_MIN: 30,
-  MONITOR_MAX_OUTPUT_PER_MIN: 50000,
-  resolveClaudeBinPath: () => null,
-  getClaudeSpawnArgs: () => [],
-  getCodexSpawnArgs: () => [],
-  CODEX_WS_PORT: 4510,
-  getCodexWsPort: () => 4510,
-  getCodexAppServerArgs: () => [],
-}));
+mockConfig();
 mock.module('../agents/agent-context.js', () => ({
   getAgentId: () => undefined,
   getCurrentConnectionId: () => undefined,
@@ -219,6 +219,8 @@ export interface ActionsEvent {
 export interface AgentThinkingEvent {
   type: typeof ServerEventType.AGENT_THINKING;
   content: string;
+  /** When true, `content` extends the previously streamed thinking text instead of replacing it. */
+  isDelta?: boolean;
   agentId?: string;
   monitorId?: string;
 }
@@ -227,6 +229,8 @@ export interface AgentResponseEvent {
   type: typeof ServerEventType.AGENT_RESPONSE;
   content: string;
   isComplete: boolean;
+  /** When true, `content` extends the previously streamed response text instead of replacing it. */
+  isDelta?: boolean;
   agentId?: string;
   monitorId?: string;
   messageId?: string;
@@ -5,8 +5,8 @@
  */
 
 import { describe, it, expect } from 'bun:test';
-import { checkHttpAuth, generateRemoteToken } from '@yaar/server/http/auth';
-import { checkWsAuth } from '@yaar/server/http/auth';
+import { checkHttpAuth, checkWsAuth, generateRemoteToken } from '@yaar/server/http/auth';
+import { makeRequest } from '../helpers/fetch-harness.js';
 
 // ── checkHttpAuth ──────────────────────────────────────────────────────────
 
@@ -60,55 +60,39 @@ describe('checkWsAuth', () => {
 describe('createFetchHandler CORS + routing', () => {
   // Heavy server deps are lazy-loaded or have graceful degradation.
   // We test the routing behavior without actually running any agents.
+  // All requests go through one shared handler (see makeRequest).
 
   it('handles OPTIONS preflight and returns 204 with no CORS from non-allowed origin', async () => {
-    const { createFetchHandler } = await import('@yaar/server/http/server');
-    const handler = createFetchHandler();
-    const req = new Request('http://localhost:8000/api/apps', {
+    const res = await makeRequest('/api/apps', {
       method: 'OPTIONS',
       headers: { origin: 'http://evil.example.com' },
     });
-    // eslint-disable-next-line @typescript-eslint/no-explicit-any
-    const res = await handler(req, {} as any);
-    expect(res?.status).toBe(204);
+    expect(res.status).toBe(204);
     // Non-allowed origin does not receive CORS header
-    expect(res?.headers.get('access-control-allow-origin')).toBeNull();
+    expect(res.headers.get('access-control-allow-origin')).toBeNull();
   });
 
   it('includes CORS headers for localhost on server port (allowed origin)', async () => {
-    const { createFetchHandler } = await import('@yaar/server/http/server');
-    const handler = createFetchHandler();
-    const req = new Request('http://localhost:8000/api/apps', {
+    const res = await makeRequest('/api/apps', {
       method: 'OPTIONS',
       headers: { origin: 'http://localhost:8000' },
     });
-    // eslint-disable-next-line @typescript-eslint/no-explicit-any
-    const res = await handler(req, {} as any);
-    expect(res?.status).toBe(204);
-    expect(res?.headers.get('access-control-allow-origin')).toBe('http://localhost:8000');
+    expect(res.status).toBe(204);
+    expect(res.headers.get('access-control-allow-origin')).toBe('http://localhost:8000');
   });
 
   it('returns 404 for completely unknown routes', async () => {
     // In bun runtime, Bun.file().exists() works natively — no dist folder
     // means static handler returns 404 for unknown routes.
-    const { createFetchHandler } = await import('@yaar/server/http/server');
-    const handler = createFetchHandler();
-    const req = new Request('http://localhost:8000/this-route-does-not-exist-at-all');
-    // eslint-disable-next-line @typescript-eslint/no-explicit-any
-    const res = await handler(req, {} as any);
-    expect(res).toBeDefined();
+    const res = await makeRequest('/this-route-does-not-exist-at-all');
     // Static fallback with no dist → 404; or index.html if dist exists → 200
-    expect([200, 404]).toContain(res!.status);
+    expect([200, 404]).toContain(res.status);
   });
 
   it('returns 200 for /health', async () => {
-    const { createFetchHandler } = await import('@yaar/server/http/server');
-    const handler = createFetchHandler();
-    const req = new Request('http://localhost:8000/health');
-    // eslint-disable-next-line @typescript-eslint/no-explicit-any
-    const res = await handler(req, {} as any);
-    expect(res?.status).toBe(200);
-    const body = await res!.json();
+    const res = await makeRequest('/health');
+    expect(res.status).toBe(200);
+    const body = await res.json();
     expect(body).toMatchObject({ status: 'ok' });
   });
 });
@@ -9,18 +9,20 @@
 import { describe, it, expect, beforeEach, mock } from 'bun:test';
 import { createMockWs } from '../helpers/mocks.js';
 
-// Mock warm pool to prevent AI provider initialization
+// Mock warm pool to prevent AI provider initialization.
+// Nothing asserts on these calls, so one plain stub object serves every lookup.
+const warmPoolStub = {
+  getPreferredProvider: () => null,
+  acquire: () => null,
+  stats: () => ({ warm: 0, pending: 0, total: 0 }),
+};
 mock.module('@yaar/server/providers/warm-pool', () => ({
-  getWarmPool: mock(() => ({
-    getPreferredProvider: () => null,
-    acquire: mock(() => null),
-    stats: () => ({ warm: 0, pending: 0, total: 0 }),
-  })),
-  initWarmPool: mock(() => Promise.resolve(true)),
-  acquireWarmProvider: mock(() => Promise.resolve(null)),
+  getWarmPool: () => warmPoolStub,
+  initWarmPool: async () => true,
+  acquireWarmProvider: async () => null,
 }));
 
-const { prepareWsData } = await import('@yaar/server/websocket/server');
+const { prepareWsData, createWsHandlers } = await import('@yaar/server/websocket/server');
 const { initSessionHub, getSessionHub } = await import('@yaar/server/session/session-hub');
 
 // ── prepareWsData ──────────────────────────────────────────────────────────
@@ -104,18 +106,17 @@ describe('SessionHub session lifecycle', () => {
 // ── WebSocket open handler ─────────────────────────────────────────────────
 
 describe('createWsHandlers open()', () => {
+  // Handlers are stateless (session state lives in the hub), so build them once
+  const handlers = createWsHandlers({
+    restoreActions: [],
+    contextMessages: [],
+  });
+
   beforeEach(() => {
     initSessionHub();
   });
 
   it('registers the connection and sends CONNECTION_STATUS event', async () => {
-    const { createWsHandlers } = await import('@yaar/server/websocket/server');
-
-    const handlers = createWsHandlers({
-      restoreActions: [],
-      contextMessages: [],
-    });
-
     const ws = createMockWs();
     // Set up ws.data as the handler expects
     (
@@ -141,13 +142,6 @@ describe('createWsHandlers open()', () => {
 
   it('session exists in hub after open()', async () => {
     const hub = getSessionHub();
-    const { createWsHandlers } = await import('@yaar/server/websocket/server');
-
-    const handlers = createWsHandlers({
-      restoreActions: [],
-      contextMessages: [],
-    });
-
     const ws = createMockWs();
     (
       ws as never as {
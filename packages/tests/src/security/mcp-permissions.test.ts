@@ -7,95 +7,77 @@
  */
 
 import { describe, it, expect, mock } from 'bun:test';
-import { extractDomain } from '@yaar/server/features/config/domains';
 
-// ── extractDomain ──────────────────────────────────────────────────────────
+type ConfigReadResult = { success: boolean; content?: string; error?: string };
 
-describe('extractDomain', () => {
-  it('extracts hostname from a simple URL', () => {
-    expect(extractDomain('https://example.com/api/data')).toBe('example.com');
-  });
+// One storage mock for the whole file; tests swap the config it serves
+// instead of re-mocking the module and re-importing domains each time.
+let allowlistConfig: ConfigReadResult = { success: false, error: 'not found' };
 
-  it('extracts hostname without port', () => {
-    expect(extractDomain('http://api.example.com:3000/path')).toBe('api.example.com');
-  });
+// Plain async stubs: nothing asserts on these calls, so no mock() recording
+mock.module('@yaar/server/storage/index', () => ({
+  configRead: async () => allowlistConfig,
+  configWrite: async () => ({ success: true }),
+}));
 
-  it('returns empty string for invalid URLs', () => {
-    expect(extractDomain('not-a-url')).toBe('');
-    expect(extractDomain('')).toBe('');
-  });
+const { extractDomain, isDomainAllowed } = await import('@yaar/server/features/config/domains');
+
+/** Serve `yaml` as the contents of curl_allowed_domains.yaml. */
+function useAllowlist(yaml: string): void {
+  allowlistConfig = { success: true, content: yaml };
+}
 
-  it('handles subdomains correctly', () => {
-    expect(extractDomain('https://sub.domain.example.co.uk/path')).toBe('sub.domain.example.co.uk');
+// ── extractDomain ──────────────────────────────────────────────────────────
+
+describe('extractDomain', () => {
+  it.each([
+    ['a simple URL', 'https://example.com/api/data', 'example.com'],
+    ['a URL with a port (port dropped)', 'http://api.example.com:3000/path', 'api.example.com'],
+    ['nested subdomains', 'https://sub.domain.example.co.uk/path', 'sub.domain.example.co.uk'],
+    ['an invalid URL', 'not-a-url', ''],
+    ['an empty string', '', ''],
+  ])('handles %s', (_label, url, expected) => {
+    expect(extractDomain(url)).toBe(expected);
   });
 });
 
 // ── isDomainAllowed ────────────────────────────────────────────────────────
 
 describe('isDomainAllowed — with storage mock', () => {
-  it('returns false for unlisted domains when allowlist is empty', async () => {
-    mock.module('@yaar/server/storage/index', () => ({
-      configRead: mock(() => Promise.resolve({ success: true, content: 'allowed_domains: []\n' })),
-      configWrite: mock(() => Promise.resolve({ success: true })),
-    }));
-
-    const { isDomainAllowed } = await import('@yaar/server/features/config/domains');
-    expect(await isDomainAllowed('example.com')).toBe(false);
-    expect(await isDomainAllowed('api.openai.com')).toBe(false);
-  });
-
-  it('returns true for domains in the allowlist', async () => {
-    mock.module('@yaar/server/storage/index', () => ({
-      configRead: mock(() =>
-        Promise.resolve({
-          success: true,
-          content: 'allowed_domains:\n  - example.com\n  - api.test.io\n',
-        }),
-      ),
-      configWrite: mock(() => Promise.resolve({ success: true })),
-    }));
-
-    const { isDomainAllowed } = await import('@yaar/server/features/config/domains');
-    expect(await isDomainAllowed('example.com')).toBe(true);
-    expect(await isDomainAllowed('api.test.io')).toBe(true);
-  });
-
-  it('returns false for domains NOT in allowlist even if others are allowed', async () => {
-    mock.module('@yaar/server/storage/index', () => ({
-      configRead: mock(() =>
-        Promise.resolve({ success: true, content: 'allowed_domains:\n  - example.com\n' }),
-      ),
-      configWrite: mock(() => Promise.resolve({ success: true })),
-    }));
-
-    const { isDomainAllowed } = await import('@yaar/server/features/config/domains');
-    expect(await isDomainAllowed('evil.example.com')).toBe(false);
-    expect(await isDomainAllowed('attacker.net')).toBe(false);
-  });
-
-  it('returns true for any domain when allow_all_domains is true', async () => {
-    mock.module('@yaar/server/storage/index', () => ({
-      configRead: mock(() =>
-        Promise.resolve({
-          success: true,
-          content: 'allow_all_domains: true\nallowed_domains: []\n',
-        }),
-      ),
-      configWrite: mock(() => Promise.resolve({ success: true })),
-    }));
-
-    const { isDomainAllowed } = await import('@yaar/server/features/config/domains');
-    expect(await isDomainAllowed('anything.example.com')).toBe(true);
-    expect(await isDomainAllowed('totally-unknown.net')).toBe(true);
+  it.each([
+    {
+      profile: 'an empty allowlist',
+      yaml: 'allowed_domains: []\n',
+      allowed: [],
+      denied: ['example.com', 'api.openai.com'],
+    },
+    {
+      profile: 'listed domains',
+      yaml: 'allowed_domains:\n  - example.com\n  - api.test.io\n',
+      allowed: ['example.com', 'api.test.io'],
+      denied: [],
+    },
+    {
+      // Subdomains of a listed domain are not implicitly allowed
+      profile: 'a single listed domain',
+      yaml: 'allowed_domains:\n  - example.com\n',
+      allowed: [],
+      denied: ['evil.example.com', 'attacker.net'],
+    },
+    {
+      profile: 'allow_all_domains: true',
+      yaml: 'allow_all_domains: true\nallowed_domains: []\n',
+      allowed: ['anything.example.com', 'totally-unknown.net'],
+      denied: [],
+    },
+  ])('applies $profile', async ({ yaml, allowed, denied }) => {
+    useAllowlist(yaml);
+    for (const domain of allowed) expect(await isDomainAllowed(domain)).toBe(true);
+    for (const domain of denied) expect(await isDomainAllowed(domain)).toBe(false);
   });
 
   it('defaults to empty allowlist (safe) when config read fails', async () => {
-    mock.module('@yaar/server/storage/index', () => ({
-      configRead: mock(() => Promise.resolve({ success: false, error: 'not found' })),
-      configWrite: mock(() => Promise.resolve({ success: true })),
-    }));
-
-    const { isDomainAllowed } = await import('@yaar/server/features/config/domains');
+    allowlistConfig = { success: false, error: 'not found' };
     // Falls back to default empty config → deny
     expect(await isDomainAllowed('example.com')).toBe(false);
   });
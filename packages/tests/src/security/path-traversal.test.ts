@@ -29,20 +29,13 @@ describe('resolveMountPath — mount-scoped path traversal', () => {
     _setMountsForTest(null);
   });
 
-  it('blocks classic ../.. traversal above a mounted alias', () => {
-    // mounts/data/../../etc/passwd — tries to escape /tmp/testmount
-    const result = resolveMountPath('mounts/data/../../etc/passwd');
-    expect(result).toBeNull();
-  });
-
-  it('blocks deeply nested traversal', () => {
-    const result = resolveMountPath('mounts/data/a/b/c/../../../../../../../../etc/shadow');
-    expect(result).toBeNull();
-  });
-
-  it('blocks backslash traversal (Windows-style)', () => {
-    const result = resolveMountPath('mounts\\data\\..\\..\\etc\\passwd');
-    expect(result).toBeNull();
+  // Each attempts to escape /tmp/testmount through the 'data' alias
+  it.each([
+    ['classic ../.. traversal', 'mounts/data/../../etc/passwd'],
+    ['deeply nested traversal', 'mounts/data/a/b/c/../../../../../../../../etc/shadow'],
+    ['backslash traversal (Windows-style)', 'mounts\\data\\..\\..\\etc\\passwd'],
+  ])('blocks %s', (_label, path) => {
+    expect(resolveMountPath(path)).toBeNull();
   });
 
   it('allows a valid sub-path within the mount', () => {